@@ -4,7 +4,7 @@ from collections import defaultdict
 from core.game_events import GameEvent, EventType
 from core.game_events_manager import GameEventManager
 from ai.models import MarkovChain, MCTS, NaiveBayes, QLearning
-from core.validation.word_validator import WordValidator
+from core.validation.word_validator import get_validator
 from core.validation.trie import Trie
 from ai.word_analysis import WordFrequencyAnalyzer
 from database.manager import DatabaseManager
@@ -44,7 +44,7 @@ class AIStrategy:
         self.difficulty = difficulty
         
         # Initialize core components
-        self.word_validator = WordValidator(word_repo)
+        self.word_validator = get_validator(word_repo)
         self.trie = Trie()
         self.word_analyzer = WordFrequencyAnalyzer(
             db_manager=self.db_manager,
@@ -290,20 +290,38 @@ class AIStrategy:
                     logger.warning(f"Error getting suggestion from {model_name}: {e}")
                     continue
         
+        if not candidates:
+            # No model suggested a formable word; fall back to the longest
+            # dictionary word the letters can form
+            formable = self.word_validator.get_valid_words(list(available_letters))
+            if formable:
+                candidates.add(max(formable, key=lambda word: (len(word), word)))
+        
         return candidates
 
     def _score_candidates(self, 
                          candidates: Set[str], 
                          available_letters: Set[str]) -> List[Tuple[str, float]]:
         """Score candidate words"""
-        scored_words = []
-        for word in candidates:
-            score = 0.0
-            for model_name, model in self.models.items():
-                if hasattr(model, "get_suggestion"):
-                    _, confidence = model.get_suggestion(available_letters)
-                    score += confidence * self.model_weights[model_name]
-            scored_words.append((word, score))
+        if not candidates:
+            return []
+            
+        # Model confidences depend only on the letters, not on the candidate, so
+        # query each model once and combine them with a single weighted dot product
+        model_names = [name for name, model in self.models.items() if hasattr(model, "get_suggestion")]
+        confidences = np.fromiter(
+            (self.models[name].get_suggestion(available_letters)[1] for name in model_names),
+            dtype=np.float64,
+            count=len(model_names)
+        )
+        weights = np.fromiter(
+            (self.model_weights[name] for name in model_names),
+            dtype=np.float64,
+            count=len(model_names)
+        )
+        score = float(confidences @ weights)
+        
+        scored_words = [(word, score) for word in candidates]
         return sorted(scored_words, key=lambda x: x[1], reverse=True)
 
     def _select_best_word(self, scored_words: List[Tuple[str, float]]) -> str:
@@ -1,10 +1,11 @@
-from typing import Dict, List, Optional, Set
-from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional, Set
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime
 from core.game_events import GameEvent, EventType
 from core.game_events_manager import GameEventManager
 
-@dataclass
+@dataclass(slots=True)
 class TurnData:
     """Represents data for a single turn in the game"""
     word: str
@@ -13,9 +14,9 @@ class TurnData:
     shared_letters: List[str]
     private_letters: List[str]
     turn_number: int
-    timestamp: datetime = datetime.now()
+    timestamp: datetime = field(default_factory=datetime.now)
 
-@dataclass
+@dataclass(slots=True)
 class GameRecord:
     """Stores complete record of a game"""
     game_id: str
@@ -31,11 +32,14 @@ class GameHistoryTracker:
     """
     Tracks and stores game history for AI training purposes.
     Captures detailed turn-by-turn data and game outcomes.
+    Only the most recent max_history_size games are retained.
     """
-    def __init__(self, event_manager: GameEventManager):
+    def __init__(self, event_manager: GameEventManager, max_history_size: int = 100):
         self.event_manager = event_manager
         self.current_game: Optional[GameRecord] = None
-        self.game_history: List[GameRecord] = []
+        # Ring buffer: appending past the limit evicts the oldest game in O(1)
+        self.max_history_size = max_history_size
+        self.game_history: Deque[GameRecord] = deque(maxlen=max_history_size)
         
         # Subscribe to game events
         self._setup_event_subscriptions()
@@ -99,7 +103,7 @@ class GameHistoryTracker:
 
     def get_game_history(self) -> List[GameRecord]:
         """Get complete game history"""
-        return self.game_history.copy()
+        return list(self.game_history)
 
     def get_current_game_state(self) -> Optional[Dict]:
         """Get current game state summary"""
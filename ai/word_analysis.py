@@ -1,20 +1,59 @@
 from typing import Dict, List, Set, DefaultDict, Tuple
-from collections import defaultdict
+from collections import Counter, OrderedDict, defaultdict
+import functools
 import math
+import numpy as np
 from core.game_events import GameEvent, EventType
 from core.game_events_manager import GameEventManager
-from core.validation.word_validator import WordValidator
+from core.validation.word_validator import get_validator
 from wordfreq import word_frequency
 import logging
 from database.repositories.word_repository import WordRepository
 from database.repositories.category_repository import CategoryRepository
 from database.manager import DatabaseManager
 import nltk
-from typing import Any
+from typing import Any, Optional
 import random
 
 logger = logging.getLogger(__name__)
 
+# Letter -> row/column index in the letter count tables
+ALPHABET_SIZE = 26
+MAX_TRACKED_POSITIONS = 32
+
+# Maximum number of word scores memoized between probability updates
+WORD_SCORE_CACHE_SIZE = 1 << 16
+# Maximum number of wordfreq lookups memoized for the process
+WORD_FREQUENCY_CACHE_SIZE = 32768
+# Maximum number of dictionary validity checks memoized per game
+VALID_WORD_CACHE_SIZE = 16384
+# Maximum number of entries kept in analyzed_words before the least recent is evicted
+MAX_ANALYZED_WORDS = 10000
+LETTER_INDEX: Dict[str, int] = {chr(ord('A') + i): i for i in range(ALPHABET_SIZE)}
+
+
+def _letter_index(letter: str) -> Optional[int]:
+    """Return the table index of a letter, only uppercasing when it isn't already A-Z."""
+    index = LETTER_INDEX.get(letter)
+    if index is None and letter:
+        index = LETTER_INDEX.get(letter.upper())
+    return index
+
+
+def _normalize_word(word: str) -> str:
+    """Return the canonical uppercase form of a word, reusing it when it is already uppercase."""
+    return word if word.isupper() else word.upper()
+
+
+@functools.lru_cache(maxsize=WORD_FREQUENCY_CACHE_SIZE)
+def _english_word_frequency(word: str) -> float:
+    """Look up a word's English frequency in wordfreq, memoized since the table is static."""
+    try:
+        return word_frequency(word.lower(), 'en')
+    except Exception as e:
+        logger.debug("No English frequency for %s: %s", word, e)
+        return 0.0
+
 class WordFrequencyAnalyzer:
     """
     Analyzes word patterns, letter frequencies, and relationships for AI decision making.
@@ -32,19 +71,37 @@ class WordFrequencyAnalyzer:
         self.db_manager = db_manager
         self.word_repo = word_repo
         self.category_repo = category_repo
-        self.analyzed_words: Dict[str, Dict[str, Any]] = {}
+        # Every entry is {"length", "frequency"}, whether loaded from usage history or
+        # submitted; scores are computed on demand through get_word_score
+        self.analyzed_words: Dict[str, Dict[str, Any]] = OrderedDict()
         self.word_frequencies: Dict[str, int] = defaultdict(int)
+        self._max_word_frequency = 0
         self.pattern_frequencies: Dict[str, int] = defaultdict(int)
-        self.letter_frequencies: Dict[str, int] = defaultdict(int)
-        self.word_lengths: Dict[int, int] = defaultdict(int)
+        self.letter_frequencies: Counter = Counter()
+        self.word_lengths: Counter = Counter()
         self.total_words = 0
         self.total_letters = 0
-        self.position_frequencies: Dict[int, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
-        self.letter_pairs: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        # Count tables indexed by [position, letter] and [current, next] (A-Z only)
+        self.position_frequencies = np.zeros((MAX_TRACKED_POSITIONS, ALPHABET_SIZE), dtype=np.int64)
+        self.position_totals = np.zeros(MAX_TRACKED_POSITIONS, dtype=np.int64)
+        self.letter_pairs = np.zeros((ALPHABET_SIZE, ALPHABET_SIZE), dtype=np.int64)
+        self.letter_pair_totals = np.zeros(ALPHABET_SIZE, dtype=np.int64)
         self.length_probabilities: Dict[int, float] = {}
         self.letter_probabilities: Dict[str, float] = {}
+        # letter_probabilities indexed by ASCII code, for scoring whole words at once
+        self._letter_probability_lut = np.zeros(128, dtype=np.float64)
+        # Set when counts change without the probabilities being rebuilt;
+        # readers rebuild them on demand
+        self._probabilities_dirty = False
+        # Scores only depend on the word and the current probabilities, so they are
+        # memoized per instance and dropped whenever probabilities are recalculated
+        self._cached_word_score = functools.lru_cache(maxsize=WORD_SCORE_CACHE_SIZE)(self._compute_word_score)
+        # Validity of scored words, dropped at game start when the word repository may change
+        self._cached_is_valid_word = functools.lru_cache(maxsize=VALID_WORD_CACHE_SIZE)(self._is_valid_word)
+        # (word repository version, result) of the last analyze_word_usage call
+        self._usage_analysis_cache: Optional[Tuple[int, Dict[str, Any]]] = None
         self.event_manager = GameEventManager()
-        self.word_validator = WordValidator(self.word_repo)
+        self.word_validator = get_validator(self.word_repo)
         
         # Set up event subscriptions
         self._setup_event_subscriptions()
@@ -66,13 +123,12 @@ class WordFrequencyAnalyzer:
         
         # Load initial word frequencies from repository
         usage_data = self.word_repo.get_word_usage()
+        usage_words = []
         for word_data in usage_data:
-            word = word_data["word"].upper()
-            self._analyze_single_word(word)
-            self.analyzed_words[word] = {
-                'length': len(word),
-                'frequency': word_data.get('frequency', 1)
-            }
+            word = _normalize_word(word_data["word"])
+            usage_words.append(word)
+            self._remember_analyzed_word(word, word_data.get('frequency', 1))
+        self._analyze_word_batch(usage_words)
             
         # Calculate initial probabilities
         self._calculate_probabilities()
@@ -81,41 +137,96 @@ class WordFrequencyAnalyzer:
         """
         Analyze patterns in a single word.
         
+        Only the raw counts are updated; callers are responsible for calling
+        _calculate_probabilities once they have finished adding words.
+        
         Args:
             word: Word to analyze (must be uppercase)
         """
-        if not word or not word.isalpha():
+        self._analyze_word_batch([word])
+
+    def _analyze_word_batch(self, words: List[str]) -> None:
+        """
+        Analyze patterns in a batch of words with a single pass over their letters.
+        
+        The words are packed into one byte buffer so that letter, position and
+        pair counts are each accumulated with one vectorized bincount.
+        Only the raw counts are updated; callers are responsible for calling
+        _calculate_probabilities once they have finished adding words.
+        
+        Args:
+            words: Words to analyze (must be uppercase); empty or non-alphabetic
+                entries are skipped
+        """
+        words = [word for word in words if word and word.isalpha()]
+        if not words:
             return
             
         # Update word length frequency
-        self.word_lengths[len(word)] += 1
-        self.total_words += 1
-        
-        # Update letter frequencies
-        for i, letter in enumerate(word):
-            self.letter_frequencies[letter] += 1
-            self.total_letters += 1
-            self.position_frequencies[i][letter] += 1
-            
-            # Update letter pairs
-            if i < len(word) - 1:
-                self.letter_pairs[letter][word[i + 1]] += 1
-                
-        # Calculate probabilities
-        self._calculate_probabilities()
+        self.word_lengths.update(map(len, words))
+        self.total_words += len(words)
+        
+        # Update letter frequencies (Counter counts the characters of a string in C)
+        letters = "".join(words)
+        self.letter_frequencies.update(letters)
+        self.total_letters += len(letters)
+        
+        # One byte per character; anything outside A-Z falls outside 0..25
+        indices = np.frombuffer(letters.encode('ascii', 'replace'), dtype=np.uint8).astype(np.intp) - ord('A')
+        is_letter = (indices >= 0) & (indices < ALPHABET_SIZE)
+        lengths = np.fromiter((len(word) for word in words), dtype=np.intp, count=len(words))
+        starts = np.cumsum(lengths) - lengths
+        positions = np.arange(len(indices)) - np.repeat(starts, lengths)
+        
+        # Update position frequencies
+        longest = int(lengths.max())
+        if longest > self.position_frequencies.shape[0]:
+            extra_rows = longest - self.position_frequencies.shape[0]
+            self.position_frequencies = np.pad(self.position_frequencies, ((0, extra_rows), (0, 0)))
+            self.position_totals = np.pad(self.position_totals, (0, extra_rows))
+        rows = self.position_frequencies.shape[0]
+        letter_positions = positions[is_letter]
+        cells = letter_positions * ALPHABET_SIZE + indices[is_letter]
+        self.position_frequencies += np.bincount(cells, minlength=rows * ALPHABET_SIZE).reshape(rows, ALPHABET_SIZE)
+        self.position_totals += np.bincount(letter_positions, minlength=rows)
+        
+        # Update letter pairs, ignoring pairs that straddle two words
+        is_pair = is_letter[:-1] & is_letter[1:] & (positions[1:] != 0)
+        current = indices[:-1][is_pair]
+        cells = current * ALPHABET_SIZE + indices[1:][is_pair]
+        self.letter_pairs += np.bincount(cells, minlength=ALPHABET_SIZE * ALPHABET_SIZE).reshape(
+            ALPHABET_SIZE, ALPHABET_SIZE
+        )
+        self.letter_pair_totals += np.bincount(current, minlength=ALPHABET_SIZE)
 
     def _calculate_probabilities(self) -> None:
         """Calculate probability distributions from frequency data."""
+        self._probabilities_dirty = False
+        self._cached_word_score.cache_clear()
         self.letter_probabilities = {
             letter: count / self.total_letters
             for letter, count in self.letter_frequencies.items()
         }
+        self._letter_probability_lut = np.zeros(128, dtype=np.float64)
+        for letter, probability in self.letter_probabilities.items():
+            if ord(letter) < 128:
+                self._letter_probability_lut[ord(letter)] = probability
         
         self.length_probabilities = {
             length: count / self.total_words
             for length, count in self.word_lengths.items()
         }
 
+    def _invalidate_probabilities(self) -> None:
+        """Mark the probabilities stale so the next read recalculates them."""
+        self._probabilities_dirty = True
+        self._cached_word_score.cache_clear()
+
+    def _ensure_probabilities(self) -> None:
+        """Recalculate the probabilities if counts changed since the last calculation."""
+        if self._probabilities_dirty:
+            self._calculate_probabilities()
+
     def get_letter_probability(self, letter: str) -> float:
         """
         Get the probability of a letter occurring.
@@ -126,9 +237,12 @@ class WordFrequencyAnalyzer:
         Returns:
             Probability of the letter occurring
         """
-        if not letter or not letter.isalpha():
-            return 0.0
-        return self.letter_probabilities.get(letter.upper(), 0.0)
+        if letter not in LETTER_INDEX:
+            if not letter or not letter.isalpha():
+                return 0.0
+            letter = letter.upper()
+        self._ensure_probabilities()
+        return self.letter_probabilities.get(letter, 0.0)
 
     def get_next_letter_probability(self, current: str, next_letter: str) -> float:
         """
@@ -141,17 +255,48 @@ class WordFrequencyAnalyzer:
         Returns:
             Probability of the letter sequence
         """
-        if not current or not next_letter or not current.isalpha() or not next_letter.isalpha():
+        current_index = _letter_index(current)
+        next_index = _letter_index(next_letter)
+        if current_index is None or next_index is None:
             return 0.0
             
-        current = current.upper()
-        next_letter = next_letter.upper()
-        
-        if current not in self.letter_pairs:
+        total_follows = self.letter_pair_totals[current_index]
+        if total_follows == 0:
             return 0.0
+        return float(self.letter_pairs[current_index, next_index] / total_follows)
+
+    def get_letter_pair_count(self, current: str, next_letter: str) -> int:
+        """
+        Get the number of times next_letter has followed current letter.
+        
+        Args:
+            current: Current letter
+            next_letter: Following letter
             
-        total_follows = sum(self.letter_pairs[current].values())
-        return self.letter_pairs[current][next_letter] / total_follows
+        Returns:
+            Number of observed occurrences of the letter pair
+        """
+        current_index = _letter_index(current)
+        next_index = _letter_index(next_letter)
+        if current_index is None or next_index is None:
+            return 0
+        return int(self.letter_pairs[current_index, next_index])
+
+    def get_position_count(self, letter: str, position: int) -> int:
+        """
+        Get the number of times a letter has been seen at a position.
+        
+        Args:
+            letter: Letter to check
+            position: Position in word
+            
+        Returns:
+            Number of observed occurrences of the letter at the position
+        """
+        letter_index = _letter_index(letter)
+        if letter_index is None or not 0 <= position < self.position_frequencies.shape[0]:
+            return 0
+        return int(self.position_frequencies[position, letter_index])
 
     def get_position_probability(self, letter: str, position: int) -> float:
         """
@@ -164,15 +309,14 @@ class WordFrequencyAnalyzer:
         Returns:
             Probability of letter at position
         """
-        if not letter or not letter.isalpha():
+        letter_index = _letter_index(letter)
+        if letter_index is None or not 0 <= position < self.position_frequencies.shape[0]:
             return 0.0
             
-        letter = letter.upper()
-        if position not in self.position_frequencies:
+        total_at_position = self.position_totals[position]
+        if total_at_position == 0:
             return 0.0
-            
-        total_at_position = sum(self.position_frequencies[position].values())
-        return self.position_frequencies[position][letter] / total_at_position
+        return float(self.position_frequencies[position, letter_index] / total_at_position)
 
     def get_word_score(self, word: str) -> float:
         """
@@ -185,22 +329,56 @@ class WordFrequencyAnalyzer:
         Returns:
             Score between 0 and 1, where higher scores indicate rarer words
         """
-        word = word.upper()
-        if not self.word_validator.is_valid_word(word):
+        word = _normalize_word(word)
+        if not self._cached_is_valid_word(word):
             return 0.0
+        return self._score_valid_word(word)
+
+    def _is_valid_word(self, word: str) -> bool:
+        """
+        Check a word against the current validator, bypassing the validity cache.
+        
+        Args:
+            word: Uppercase word to check
+            
+        Returns:
+            True if the word is valid
+        """
+        return self.word_validator.is_valid_word(word)
+
+    def _score_valid_word(self, word: str) -> float:
+        """
+        Score a word that has already been uppercased and validated.
+        
+        Args:
+            word: Uppercase, dictionary-valid word
             
+        Returns:
+            Score between 0 and 1, where higher scores indicate rarer words
+        """
+        self._ensure_probabilities()
+        return self._cached_word_score(word)
+
+    def _compute_word_score(self, word: str) -> float:
+        """
+        Compute the score for an uppercase, validated word without caching.
+        
+        Args:
+            word: Uppercase, dictionary-valid word
+            
+        Returns:
+            Score between 0 and 1, where higher scores indicate rarer words
+        """
         # Get WordFreq frequency score
-        try:
-            freq_score = word_frequency(word.lower(), 'en')
-        except:
-            freq_score = 0.0
+        freq_score = _english_word_frequency(word)
             
         # Get length score (favor medium length words)
         length = len(word)
         length_score = 1.0 - abs(length - 7) / 7  # Peak at 7 letters
         
         # Get letter rarity score
-        letter_score = sum(self.get_letter_probability(c) for c in word) / len(word)
+        codes = np.frombuffer(word.encode('ascii', 'replace'), dtype=np.uint8)
+        letter_score = float(self._letter_probability_lut[codes].mean())
         
         # Combine scores with weights
         weights = {
@@ -221,20 +399,53 @@ class WordFrequencyAnalyzer:
         """
         Handle word submission events by analyzing the submitted word.
         
+        Probabilities are only marked stale here and recalculated on the next
+        read, so a run of submissions costs at most one recalculation.
+        
         Args:
             event: GameEvent containing the submitted word
         """
         if not event.data or "word" not in event.data:
             return
             
-        word = event.data["word"].upper()
+        word = _normalize_word(event.data["word"])
         if self.word_validator.validate_word(word):
             self._analyze_single_word(word)
-            self.analyzed_words[word] = {
-                "score": self.get_word_score(word),
-                "frequency": self.word_frequencies.get(word, 0)
-            }
-            self._calculate_probabilities()
+            self._record_word_frequency(word)
+            self._invalidate_probabilities()
+            self._remember_analyzed_word(word, self.word_frequencies.get(word, 0))
+
+    def _remember_analyzed_word(self, word: str, frequency: int) -> None:
+        """
+        Store a word in analyzed_words as the most recent entry.
+        
+        Only the MAX_ANALYZED_WORDS most recent words are kept, bounding memory
+        over long sessions and large usage histories.
+        
+        Args:
+            word: Uppercase word
+            frequency: Seen count to store for the word
+        """
+        self.analyzed_words[word] = {
+            "length": len(word),
+            "frequency": frequency
+        }
+        self.analyzed_words.move_to_end(word)
+        while len(self.analyzed_words) > MAX_ANALYZED_WORDS:
+            self.analyzed_words.popitem(last=False)
+
+    def _record_word_frequency(self, word: str, count: int = 1) -> None:
+        """
+        Increment the seen count of a word, keeping the running maximum in sync.
+        
+        Args:
+            word: Uppercase word
+            count: Number of occurrences to add
+        """
+        frequency = self.word_frequencies[word] + count
+        self.word_frequencies[word] = frequency
+        if frequency > self._max_word_frequency:
+            self._max_word_frequency = frequency
 
     def _handle_game_start(self, event: GameEvent) -> None:
         """
@@ -243,6 +454,8 @@ class WordFrequencyAnalyzer:
         Args:
             event: GameEvent for game start
         """
+        self._cached_is_valid_word.cache_clear()
+        
         # Reset analysis if requested in event data
         if event.data and event.data.get("reset_analysis", False):
             self._initialize_analysis()
@@ -256,49 +469,73 @@ class WordFrequencyAnalyzer:
         """
         # Get words from repository instead of preloaded list
         usage_data = self.word_repo.get_word_usage()
-        return [word_data["word"].upper() for word_data in usage_data]
+        return [_normalize_word(word_data["word"]) for word_data in usage_data]
 
     def analyze_word_usage(self) -> Dict[str, any]:
         """
         Analyze word usage patterns from the database.
         
+        The result is reused until the word repository version changes, so
+        callers should treat it as read-only.
+        
         Returns:
             Dictionary containing usage statistics
         """
+        version = self.word_repo.version
+        if self._usage_analysis_cache is not None and self._usage_analysis_cache[0] == version:
+            return self._usage_analysis_cache[1]
+            
         usage_data = self.word_repo.get_word_usage()
-        analysis = {
-            "total_words": len(usage_data),
-            "word_frequencies": defaultdict(int),
-            "length_frequencies": defaultdict(int),
-            "pattern_frequencies": defaultdict(int)
-        }
         
+        # Tally word, length and pattern (prefix/suffix) frequencies in a single
+        # pass, keying patterns by their raw letters until the end
+        word_frequencies = defaultdict(int)
+        length_frequencies = defaultdict(int)
+        prefix_counts: Counter = Counter()
+        suffix_counts: Counter = Counter()
         for word_data in usage_data:
-            word = word_data["word"].upper()
+            word = _normalize_word(word_data["word"])
             frequency = word_data["frequency"]
-            analysis["word_frequencies"][word] = frequency
-            analysis["length_frequencies"][len(word)] += frequency
-            
-            # Analyze patterns (e.g. prefixes, suffixes)
-            if len(word) >= 3:
-                prefix = word[:3]
-                suffix = word[-3:]
-                analysis["pattern_frequencies"][f"prefix_{prefix}"] += frequency
-                analysis["pattern_frequencies"][f"suffix_{suffix}"] += frequency
+            length = len(word)
+            word_frequencies[word] = frequency
+            length_frequencies[length] += frequency
+            if length > 3:
+                prefix_counts[word[:3]] += frequency
+                suffix_counts[word[-3:]] += frequency
+            elif length == 3:
+                # The whole word is both its prefix and suffix; no slices needed
+                prefix_counts[word] += frequency
+                suffix_counts[word] += frequency
+        
+        pattern_frequencies = defaultdict(int)
+        for prefix, total in prefix_counts.items():
+            pattern_frequencies[f"prefix_{prefix}"] = total
+        for suffix, total in suffix_counts.items():
+            pattern_frequencies[f"suffix_{suffix}"] = total
                 
+        analysis = {
+            "total_words": len(usage_data),
+            "word_frequencies": word_frequencies,
+            "length_frequencies": length_frequencies,
+            "pattern_frequencies": pattern_frequencies
+        }
+        self._usage_analysis_cache = (version, analysis)
         return analysis
 
     def _initialize_analysis(self) -> None:
         """Initialize or reset analysis data structures."""
         self.analyzed_words.clear()
         self.word_frequencies.clear()
+        self._max_word_frequency = 0
         self.pattern_frequencies.clear()
         self.letter_frequencies.clear()
         self.word_lengths.clear()
         self.total_words = 0
         self.total_letters = 0
-        self.position_frequencies.clear()
-        self.letter_pairs.clear()
+        self.position_frequencies = np.zeros((MAX_TRACKED_POSITIONS, ALPHABET_SIZE), dtype=np.int64)
+        self.position_totals = np.zeros(MAX_TRACKED_POSITIONS, dtype=np.int64)
+        self.letter_pairs.fill(0)
+        self.letter_pair_totals.fill(0)
 
     def get_patterns(self, word: str) -> Dict[str, str]:
         """
@@ -310,7 +547,7 @@ class WordFrequencyAnalyzer:
         Returns:
             Dictionary mapping pattern types to patterns
         """
-        word = word.upper()
+        word = _normalize_word(word)
         return {
             'prefix': word[:3] if len(word) >= 3 else word,
             'suffix': word[-3:] if len(word) >= 3 else word,
@@ -386,11 +623,11 @@ class WordFrequencyAnalyzer:
         Returns:
             Rarity score between 0 and 1
         """
-        word = word.upper()
+        word = _normalize_word(word)
         freq = self.word_frequencies.get(word, 0)
         if freq == 0:
             return 1.0  # Very rare
-        return 1.0 - (freq / max(self.word_frequencies.values()))
+        return 1.0 - (freq / self._max_word_frequency)
         
     def get_word_frequency(self, word: str) -> int:
         """
@@ -402,7 +639,7 @@ class WordFrequencyAnalyzer:
         Returns:
             Number of times the word has been seen
         """
-        word = word.upper()
+        word = _normalize_word(word)
         return self.word_frequencies.get(word, 0)
 
     def get_popular_words(self, limit: int = 10) -> List[Dict]:
@@ -1,7 +1,27 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, List
 from datetime import datetime
+import atexit
 import logging
+import time
+
+# Number of historical records held in memory before they are written out
+# together; whatever is still pending is written at exit
+LOG_FLUSH_THRESHOLD = 256
+
+def _clock_timestamp() -> str:
+    """
+    Format the current local time as HH:MM:SS.mmm.
+    
+    Built from time.time_ns() rather than datetime.strftime, which is
+    comparatively slow for per-record logging.
+    
+    Returns:
+        The formatted timestamp
+    """
+    seconds, nanoseconds = divmod(time.time_ns(), 1_000_000_000)
+    local = time.localtime(seconds)
+    return f"{local.tm_hour:02d}:{local.tm_min:02d}:{local.tm_sec:02d}.{nanoseconds // 1_000_000:03d}"
 
 class AnalysisOutput(ABC):
     """
@@ -40,7 +60,7 @@ class DeveloperAnalysis(AnalysisOutput):
         Args:
             data: Analysis data including AI decisions, probabilities, etc.
         """
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+        timestamp = _clock_timestamp()
         formatted_data = self._format_dev_data(data)
         
         # Structure for VS Code output
@@ -115,6 +135,9 @@ class HistoricalAnalysis(AnalysisOutput):
         super().__init__()
         self.log_file_path = log_file_path
         self.detail_level = 3  # Full detail for historical record
+        self._pending_records: List[str] = []
+        # Records below the flush threshold would otherwise be lost on shutdown
+        atexit.register(self.flush)
         
     def process_analysis(self, data: Dict[str, Any]) -> None:
         """
@@ -137,11 +160,23 @@ class HistoricalAnalysis(AnalysisOutput):
                f"Full Data: {data}"
                
     def _write_to_log(self, formatted_data: str) -> None:
-        """Write formatted data to log file"""
-        # Implementation would write to log file
-        pass
+        """Buffer formatted data, writing to the log file once enough records are pending"""
+        self._pending_records.append(formatted_data + "\n")
+        if len(self._pending_records) >= LOG_FLUSH_THRESHOLD:
+            self.flush()
+            
+    def flush(self) -> None:
+        """Append all pending records to the log file in a single write"""
+        if not self._pending_records:
+            return
+            
+        try:
+            with open(self.log_file_path, "a", encoding="utf-8") as log_file:
+                log_file.write("".join(self._pending_records))
+        except OSError as e:
+            self.logger.error("Error writing analysis log %s: %s", self.log_file_path, e)
+        self._pending_records.clear()
         
     def clear(self) -> None:
-        """Clear log file"""
-        # Implementation would clear log file
-        pass
\ No newline at end of file
+        """Drop records not yet written; the log file itself is kept"""
+        self._pending_records.clear()
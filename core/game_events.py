@@ -1,5 +1,5 @@
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Dict
 from datetime import datetime
 
@@ -38,7 +38,7 @@ class EventType(Enum):
     # Game settings events
     DIFFICULTY_CHANGED = "difficulty_changed"
 
-@dataclass
+@dataclass(slots=True)
 class GameEvent:
     """
     Represents a game event with its type, associated data, and metadata.
@@ -46,15 +46,10 @@ class GameEvent:
     Attributes:
         type (EventType): The type of event
         data (Dict[str, Any]): Event-specific data
-        timestamp (datetime): When the event occurred
+        timestamp (datetime): When the event was created (ignored when comparing events)
         debug_data (Dict[str, Any]): Optional analysis/debug information
     """
     type: EventType
     data: Dict[str, Any]
-    timestamp: datetime = datetime.now()
-    debug_data: Dict[str, Any] = None
-
-    def __post_init__(self):
-        """Validate event data after initialization"""
-        if self.debug_data is None:
-            self.debug_data = {}
\ No newline at end of file
+    timestamp: datetime = field(default_factory=datetime.now)
+    debug_data: Dict[str, Any] = field(default_factory=dict)
\ No newline at end of file
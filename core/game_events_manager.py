@@ -1,6 +1,6 @@
-from typing import Dict, List, Callable, Optional
+from typing import Deque, Dict, List, Callable, Optional, Tuple, Union
 import logging
-from collections import defaultdict
+from collections import deque
 from core.game_events import GameEvent, EventType
 
 class GameEventManager:
@@ -23,44 +23,113 @@ class GameEventManager:
         if hasattr(self, 'initialized'):
             return
             
-        # Dictionary of event types to list of callback functions
-        self.listeners: Dict[EventType, List[Callable]] = defaultdict(list)
+        # Dictionary of event types to callback functions. Each tuple is replaced
+        # rather than mutated, so emit can iterate it without copying even if a
+        # listener subscribes or unsubscribes during dispatch.
+        self.listeners: Dict[EventType, Tuple[Callable, ...]] = {}
+        # The same callbacks keyed by the token subscribe returned, so
+        # unsubscribing by token is a single dict removal
+        self._subscriptions: Dict[EventType, Dict[int, Callable]] = {}
+        self._next_token = 0
         
-        # Analysis output handlers
-        self.dev_output = None  # VS Code output
-        self.user_output = None  # Game UI output
-        self.history_output = None  # Log file output
+        # Analysis output handlers, set through the properties below
+        self._dev_output = None  # VS Code output
+        self._user_output = None  # Game UI output
+        self._history_output = None  # Log file output
+        # The outputs that are set, rebuilt on assignment so emit only loops over them
+        self._analysis_sinks: Tuple = ()
         
-        # Event history for debugging and analysis
-        self.event_history: List[GameEvent] = []
+        # Event history for debugging and analysis; the deque drops the
+        # oldest event once max_history_size is reached
         self.max_history_size = 1000
+        self.event_history: Deque[GameEvent] = deque(maxlen=self.max_history_size)
+        # The same events split by type, so filtered lookups skip the scan
+        self._history_by_type: Dict[EventType, Deque[GameEvent]] = {
+            event_type: deque(maxlen=self.max_history_size) for event_type in EventType
+        }
         
         # Configure logging
         self.logger = logging.getLogger(__name__)
         self.initialized = True
 
-    def subscribe(self, event_type: EventType, callback: Callable) -> None:
+    @property
+    def dev_output(self):
+        """Analysis output for development (VS Code output)."""
+        return self._dev_output
+
+    @dev_output.setter
+    def dev_output(self, output) -> None:
+        self._dev_output = output
+        self._update_analysis_sinks()
+
+    @property
+    def user_output(self):
+        """Analysis output for the game UI."""
+        return self._user_output
+
+    @user_output.setter
+    def user_output(self, output) -> None:
+        self._user_output = output
+        self._update_analysis_sinks()
+
+    @property
+    def history_output(self):
+        """Analysis output written to the log file."""
+        return self._history_output
+
+    @history_output.setter
+    def history_output(self, output) -> None:
+        self._history_output = output
+        self._update_analysis_sinks()
+
+    def _update_analysis_sinks(self) -> None:
+        """Rebuild the tuple of analysis outputs that are set, in dev, user, history order."""
+        self._analysis_sinks = tuple(
+            output for output in (self._dev_output, self._user_output, self._history_output)
+            if output
+        )
+
+    def subscribe(self, event_type: EventType, callback: Callable) -> int:
         """
         Subscribe a callback function to a specific event type.
         
         Args:
             event_type: The type of event to subscribe to
             callback: Function to call when event occurs
+            
+        Returns:
+            Token identifying this subscription, for unsubscribe
         """
-        self.listeners[event_type].append(callback)
-        self.logger.debug(f"Subscribed to {event_type.value}")
+        token = self._next_token
+        self._next_token += 1
+        subscriptions = self._subscriptions.setdefault(event_type, {})
+        subscriptions[token] = callback
+        self.listeners[event_type] = tuple(subscriptions.values())
+        self.logger.debug("Subscribed to %s", event_type.value)
+        return token
 
-    def unsubscribe(self, event_type: EventType, callback: Callable) -> None:
+    def unsubscribe(self, event_type: EventType, subscription: Union[int, Callable]) -> None:
         """
-        Remove a callback function from an event type's subscribers.
+        Remove a subscription from an event type's subscribers.
         
         Args:
             event_type: The type of event to unsubscribe from
-            callback: Function to remove from subscribers
+            subscription: Token returned by subscribe, or the subscribed callback
+                (removes its earliest subscription)
         """
-        if event_type in self.listeners:
-            self.listeners[event_type].remove(callback)
-            self.logger.debug(f"Unsubscribed from {event_type.value}")
+        subscriptions = self._subscriptions.get(event_type)
+        if not subscriptions:
+            return
+            
+        if isinstance(subscription, int):
+            token = subscription
+        else:
+            # Callers holding only the callback fall back to a scan
+            token = next((token for token, callback in subscriptions.items()
+                          if callback == subscription), None)
+        if subscriptions.pop(token, None) is not None:
+            self.listeners[event_type] = tuple(subscriptions.values())
+            self.logger.debug("Unsubscribed from %s", event_type.value)
 
     def emit(self, event: GameEvent) -> None:
         """
@@ -76,7 +145,7 @@ class GameEventManager:
         self._handle_analysis(event)
         
         # Notify all listeners
-        for callback in self.listeners[event.type]:
+        for callback in self.listeners.get(event.type, ()):
             try:
                 callback(event)
             except Exception as e:
@@ -91,8 +160,7 @@ class GameEventManager:
             event: Event to add to history
         """
         self.event_history.append(event)
-        if len(self.event_history) > self.max_history_size:
-            self.event_history.pop(0)
+        self._history_by_type[event.type].append(event)
 
     def _handle_analysis(self, event: GameEvent) -> None:
         """
@@ -101,26 +169,26 @@ class GameEventManager:
         Args:
             event: Event containing analysis data
         """
-        if not event.debug_data:
+        if not event.debug_data or not self._analysis_sinks:
             return
             
         # Format analysis data for different outputs
-        if self.dev_output:
-            self.dev_output.process_analysis(event)
-        if self.user_output:
-            self.user_output.process_analysis(event)
-        if self.history_output:
-            self.history_output.process_analysis(event)
+        for output in self._analysis_sinks:
+            output.process_analysis(event)
 
     def clear_listeners(self) -> None:
         """Remove all event listeners."""
         self.listeners.clear()
+        self._subscriptions.clear()
         self.logger.debug("All event listeners cleared")
 
     def get_recent_events(self, event_type: Optional[EventType] = None) -> List[GameEvent]:
         """
         Get recent events, optionally filtered by type.
         
+        Each type keeps its own max_history_size most recent events, so a
+        filtered result can reach further back than the combined history.
+        
         Args:
             event_type: Optional filter for specific event type
             
@@ -128,8 +196,8 @@ class GameEventManager:
             List of recent GameEvents
         """
         if event_type is None:
-            return self.event_history.copy()
-        return [e for e in self.event_history if e.type == event_type]
+            return list(self.event_history)
+        return list(self._history_by_type[event_type])
 
 # Create singleton instance
 game_events_manager = GameEventManager()
\ No newline at end of file
@@ -1,7 +1,7 @@
 # core/game_history.py
 # Tracks and manages game history, including turns, scores, and events.
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 import logging
@@ -9,7 +9,7 @@ from .game_events import GameEvent
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class Turn:
     """
     Represents a single turn in the game.
@@ -19,19 +19,17 @@ class Turn:
         player_score (int): Score earned for the word
         ai_word (Optional[str]): Word submitted by AI (if applicable)
         ai_score (Optional[int]): Score earned by AI (if applicable)
-        timestamp (datetime): When the turn occurred
+        timestamp (datetime): When the turn was created (ignored when comparing turns)
         events (List[GameEvent]): Events that occurred during the turn
     """
     player_word: str
     player_score: int
     ai_word: Optional[str] = None
     ai_score: Optional[int] = None
-    timestamp: datetime = datetime.now()
-    events: List[GameEvent] = None
+    timestamp: datetime = field(default_factory=datetime.now)
+    events: List[GameEvent] = field(default_factory=list)
 
     def __post_init__(self):
-        if self.events is None:
-            self.events = []
         # Normalize case for words
         self.player_word = self.player_word.upper()
         if self.ai_word:
@@ -80,7 +78,7 @@ class GameHistory:
         self.total_player_score += turn.player_score
         if turn.ai_score is not None:
             self.total_ai_score += turn.ai_score
-        logger.debug(f"Turn added: {turn.player_word} ({turn.player_score} points)")
+        logger.debug("Turn added: %s (%s points)", turn.player_word, turn.player_score)
         
     def add_event(self, event: GameEvent) -> None:
         """
@@ -90,7 +88,7 @@ class GameHistory:
             event (GameEvent): The event to add
         """
         self.event_history.append(event)
-        logger.debug(f"Event added: {event.type}")
+        logger.debug("Event added: %s", event.type.value)
         
     def get_turn_count(self) -> int:
         """
@@ -1,6 +1,7 @@
 # core/letter_pool.py
 # Handles generation of shared and boggle letter pools.
 
+import math
 import random
 import logging
 
@@ -8,6 +9,8 @@ logger = logging.getLogger(__name__)
 
 # Common English letters for shared pool (higher frequency)
 COMMON_LETTERS = list("ETAOINSHRDLU") # List of common letters, used for the shared letters.
+SHARED_VOWELS = [l for l in COMMON_LETTERS if l in "AEIOU"] # Common letters that are vowels.
+SHARED_CONSONANTS = [l for l in COMMON_LETTERS if l not in "AEIOU"] # Common letters that are consonants.
 
 # Full alphabet for boggle letters, weighted by usage frequency
 WEIGHTED_ALPHABET = [ # List of letters, weighted by how often they are used in the English language.
@@ -42,13 +45,22 @@ def generate_letter_pool(num_shared=4, num_boggle=6):
     """
     Generates a pool of shared letters and player-specific boggle letters.
     Ensures shared letters are distinct and include at least one vowel and one consonant.
+    Every valid shared set is equally likely, without retrying rejected samples.
     """
-    while True: # Loop until a valid set of shared letters is generated.
-        shared = random.sample(COMMON_LETTERS, num_shared) # Randomly select shared letters.
-        if any(l in "AEIOU" for l in shared) and any(l not in "AEIOU" for l in shared): # Check if there is at least one vowel and one consonant.
-            break # Exit the loop if the shared letters meet the criteria.
-
-    boggle = [random.choice(WEIGHTED_ALPHABET) for _ in range(num_boggle)] # Randomly select boggle letters, respecting the weighted alphabet.
-    logger.debug(f"Generated shared letters: {shared}") # Log the generated shared letters.
-    logger.debug(f"Generated boggle letters: {boggle}") # Log the generated boggle letters.
+    if num_shared < 2:
+        raise ValueError("num_shared must be at least 2 to include a vowel and a consonant")
+    if num_shared > len(COMMON_LETTERS):
+        raise ValueError(f"num_shared must be at most {len(COMMON_LETTERS)}, the number of common letters")
+
+    # Pick how many vowels to use, weighted by how many valid sets have that many vowels.
+    vowel_counts = range(max(1, num_shared - len(SHARED_CONSONANTS)), min(len(SHARED_VOWELS), num_shared - 1) + 1)
+    weights = [math.comb(len(SHARED_VOWELS), v) * math.comb(len(SHARED_CONSONANTS), num_shared - v) for v in vowel_counts]
+    num_vowels = random.choices(vowel_counts, weights=weights)[0]
+
+    shared = random.sample(SHARED_VOWELS, num_vowels) + random.sample(SHARED_CONSONANTS, num_shared - num_vowels) # Randomly select shared letters.
+    random.shuffle(shared) # Mix vowels and consonants so their positions are random.
+
+    boggle = random.choices(WEIGHTED_ALPHABET, k=num_boggle) # Randomly select boggle letters, respecting the weighted alphabet.
+    logger.debug("Generated shared letters: %s", shared) # Log the generated shared letters.
+    logger.debug("Generated boggle letters: %s", boggle) # Log the generated boggle letters.
     return shared, boggle # Return the shared and boggle letters.
\ No newline at end of file
@@ -1,5 +1,8 @@
 class TrieNode:
     """A node in the Trie data structure."""
+    # No per-node __dict__; a dictionary trie has hundreds of thousands of nodes
+    __slots__ = ('children', 'is_end', 'word_count', 'prefix_count')
+    
     def __init__(self):
         self.children = {}  # Dictionary mapping characters to child nodes
         self.is_end = False  # Flag to mark end of a word
@@ -117,29 +120,30 @@ class Trie:
 
         word = word.upper()
         node = self.root
-        path = [(node, '')]  # Stack of (node, char) pairs
+        parents = []  # (parent, char) for each step, so cleanup needs no searching
         
         # Traverse to the word's end node, storing the path
         for char in word:
             if char not in node.children:
                 return False
+            parents.append((node, char))
             node = node.children[char]
-            path.append((node, char))
         
         # Word must exist to be deleted
         if not node.is_end:
             return False
         
         # Update word count and end flag
-        node.is_end = False
         node.word_count -= 1
+        node.is_end = node.word_count > 0
         self.total_words -= 1
         
-        # Update prefix counts and remove empty nodes
-        for node, char in reversed(path):
-            node.prefix_count -= 1
-            if node.prefix_count == 0 and path[-1][0] != node:
-                parent = path[path.index((node, char)) - 1][0]
+        # Update prefix counts and remove nodes no word passes through any more
+        self.root.prefix_count -= 1
+        for parent, char in reversed(parents):
+            child = parent.children[char]
+            child.prefix_count -= 1
+            if child.prefix_count == 0:
                 del parent.children[char]
 
         return True
@@ -164,15 +168,23 @@ class Trie:
         if not node:
             return words
             
-        def dfs(node: TrieNode, current_word: str):
-            if len(words) >= max_words:
-                return
+        # Iterative depth-first walk sharing one buffer of letters below the
+        # prefix; a word string is only built when one is emitted
+        letters = []
+        stack = [(node, 0, '')]
+        while stack and len(words) < max_words:
+            node, depth, char = stack.pop()
+            del letters[depth:]
+            if char:
+                letters.append(char)
                 
             if node.is_end:
-                words.append(current_word)
+                words.append(prefix + ''.join(letters))
                 
-            for char, child in node.children.items():
-                dfs(child, current_word + char)
-        
-        dfs(node, prefix)
-        return words
\ No newline at end of file
+            # Reversed so children are visited in insertion order, as before
+            child_depth = len(letters)
+            stack.extend(
+                (child, child_depth, child_char)
+                for child_char, child in reversed(node.children.items())
+            )
+        return words
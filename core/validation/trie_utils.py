@@ -2,7 +2,7 @@ import os
 import json
 import pickle
 from typing import List, Set, Optional
-from .trie import Trie
+from .trie import Trie, TrieNode
 
 class TrieUtils:
     @staticmethod
@@ -21,12 +21,10 @@ class TrieUtils:
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"Word list file not found: {file_path}")
             
-        words = set()
+        # One read and one upper() for the whole file, then split
         with open(file_path, 'r', encoding='utf-8') as file:
-            for line in file:
-                word = line.strip().upper()
-                if word:  # Skip empty lines
-                    words.add(word)
+            words = {line.strip() for line in file.read().upper().splitlines()}
+        words.discard('')  # Skip empty lines
         return words
 
     @staticmethod
@@ -46,6 +44,12 @@ class TrieUtils:
     def build_trie_from_words(words: Set[str]) -> Trie:
         """Build a Trie from a set of words.
         
+        The words are uppercased and sorted once, so consecutive words share
+        their common prefix and nodes are only created from the point where a
+        word diverges from the previous one. A node stays on the current path
+        for a contiguous run of words, which gives its prefix count when it is
+        left. The result matches inserting each word with Trie.insert.
+        
         Args:
             words: Set of words to add to the Trie
             
@@ -53,8 +57,38 @@ class TrieUtils:
             Populated Trie instance
         """
         trie = Trie()
-        for word in words:
-            trie.insert(word)
+        sorted_words = sorted(word.upper() for word in words if word)
+        
+        # (node, index of the first word passing through it) for the previous word
+        path = [(trie.root, 0)]
+        previous = ""
+        for index, word in enumerate(sorted_words):
+            shared = 0
+            limit = min(len(previous), len(word))
+            while shared < limit and previous[shared] == word[shared]:
+                shared += 1
+                
+            # Nodes below the shared prefix are finished: every word through them is behind us
+            while len(path) > shared + 1:
+                node, first = path.pop()
+                node.prefix_count = index - first
+                
+            node = path[-1][0]
+            for char in word[shared:]:
+                child = TrieNode()
+                node.children[char] = child
+                path.append((child, index))
+                node = child
+                
+            node.is_end = True
+            node.word_count += 1
+            previous = word
+            
+        for node, first in path:
+            node.prefix_count = len(sorted_words) - first
+            
+        trie.total_words = len(sorted_words)
+        trie.max_word_length = max(map(len, sorted_words), default=0)
         return trie
 
     @staticmethod
@@ -1,22 +1,134 @@
-from typing import Set, List, Optional
+from typing import Dict, FrozenSet, Set, List, Optional, Sequence, Tuple
+import bisect
+import functools
 import nltk
-from .trie import Trie
-from .trie_utils import TrieUtils
+import numpy as np
 import os
+import atexit
 import logging
+import threading
 from database.repositories.word_repository import WordRepository
 from database.manager import DatabaseManager
 
 logger = logging.getLogger(__name__)
 
+ALPHABET_SIZE = 26
+# Letter count rows are padded to whole uint64 words so they can be compared eight bytes at a time
+PACKED_COUNT_BYTES = 32
+HIGH_BITS = np.uint64(0x8080808080808080)
+
+# Submitted words are recorded in the repository in batches of this many uses
+USAGE_FLUSH_THRESHOLD = 64
+
+# Number of distinct spellings whose lookup result each validator remembers
+VALID_WORD_CACHE_SIZE = 4096
+
+# Filtered NLTK word list, reused while the corpus file is unchanged
+NLTK_WORDS_CACHE_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'nltk_words.cache')
+
+def _corpus_stamp(location) -> Optional[str]:
+    """Identify the NLTK words corpus by file path, size and modification time.
+    
+    Args:
+        location: Path pointer returned by nltk.data.find
+        
+    Returns:
+        Stamp string, or None if the corpus is not a file on disk
+    """
+    zip_file = getattr(location, 'zipfile', None)
+    path = getattr(zip_file, 'filename', None) or getattr(location, 'path', None)
+    if not isinstance(path, str) or not os.path.exists(path):
+        return None
+    stat = os.stat(path)
+    return f"{path}|{stat.st_size}|{stat.st_mtime_ns}|3-15"
+
+def _read_words_cache(cache_path: str, stamp: str) -> Optional[Set[str]]:
+    """Read cached words if the cache was written for the given corpus stamp.
+    
+    Args:
+        cache_path: Path of the cache file
+        stamp: Expected corpus stamp
+        
+    Returns:
+        Set of cached words, or None if the cache is missing or stale
+    """
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            if f.readline().rstrip('\n') != stamp:
+                return None
+            return set(f.read().splitlines())
+    except OSError:
+        return None
+
+def _write_words_cache(cache_path: str, stamp: str, words: Set[str]) -> None:
+    """Write words to the cache, replacing any previous cache atomically.
+    
+    Args:
+        cache_path: Path of the cache file
+        stamp: Corpus stamp to record
+        words: Words to cache
+    """
+    temp_path = cache_path + ".tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(stamp + "\n")
+            f.write("\n".join(sorted(words)))
+        os.replace(temp_path, cache_path)
+    except OSError as e:
+        logger.warning(f"Could not write NLTK word cache {cache_path}: {e}")
+
+def _read_nltk_words() -> FrozenSet[str]:
+    """Read the NLTK words corpus, keeping uppercased words of 3 to 15 letters.
+    
+    Returns:
+        Set of filtered words
+    """
+    from nltk.corpus import words
+    return frozenset(word.upper() for word in words.words() if 3 <= len(word) <= 15)
+
+@functools.lru_cache(maxsize=4)
+def _load_nltk_words(stamp: str) -> FrozenSet[str]:
+    """Get the filtered NLTK words for a corpus, shared by every validator in the process.
+    
+    Falls back to the on-disk cache, and then to reading the corpus, the
+    first time a corpus stamp is seen.
+    
+    Args:
+        stamp: Corpus stamp from _corpus_stamp
+        
+    Returns:
+        Set of filtered words
+    """
+    cached_words = _read_words_cache(NLTK_WORDS_CACHE_PATH, stamp)
+    if cached_words is not None:
+        logger.debug(f"Read {len(cached_words)} NLTK words from {NLTK_WORDS_CACHE_PATH}")
+        return frozenset(cached_words)
+        
+    nltk_words = _read_nltk_words()
+    _write_words_cache(NLTK_WORDS_CACHE_PATH, stamp, nltk_words)
+    return nltk_words
+
+@functools.lru_cache(maxsize=4)
+def _sorted_words(words: FrozenSet[str]) -> Tuple[str, ...]:
+    """Sort a word set once per process for the validators that share it.
+    
+    Args:
+        words: Word set, typically the shared result of _load_nltk_words
+        
+    Returns:
+        The words in sorted order
+    """
+    return tuple(sorted(words))
+
 class WordValidator:
     """Validates words using NLTK and tracks word usage in the database."""
     
-    def __init__(self, word_repo: WordRepository, use_nltk: bool = True, custom_dictionary_path: Optional[str] = None):
+    def __init__(self, word_repo: Optional[WordRepository] = None, use_nltk: bool = True, custom_dictionary_path: Optional[str] = None):
         """Initialize the WordValidator.
         
         Args:
-            word_repo: Repository for word usage data
+            word_repo: Repository for word usage data, or None to validate without recording usage
             use_nltk: Whether to use NLTK for word validation
             custom_dictionary_path: Path to a custom dictionary file
         """
@@ -24,34 +136,65 @@ class WordValidator:
         self.use_nltk = use_nltk
         self.custom_words = set()
         self.nltk_words = set()
+        # Uses of submitted words not yet written, per repository by id; a
+        # repository is only referenced here until its uses are flushed
+        self._pending_usage: Dict[int, Tuple[WordRepository, Dict[str, int]]] = {}
+        self._pending_use_count = 0
         
         if use_nltk:
             # Ensure NLTK words corpus is downloaded
+            corpus_location = None
             try:
-                nltk.data.find('corpora/words')
+                corpus_location = nltk.data.find('corpora/words')
             except LookupError:
                 nltk.download('words', quiet=True)
+                # Locate the downloaded corpus so its word list is cached too
+                try:
+                    corpus_location = nltk.data.find('corpora/words')
+                except LookupError:
+                    pass
                 
-            # Load NLTK words
+            # Reuse the filtered list loaded earlier in this process or by an earlier run
+            stamp = _corpus_stamp(corpus_location)
             try:
-                from nltk.corpus import words
-                nltk_words = words.words()
-                self.nltk_words = {word.upper() for word in nltk_words if 3 <= len(word) <= 15}
+                self.nltk_words = _load_nltk_words(stamp) if stamp else _read_nltk_words()
                 logger.debug(f"Loaded {len(self.nltk_words)} NLTK words")
             except Exception as e:
                 logger.error(f"Error loading NLTK words: {e}")
                 
         if custom_dictionary_path and os.path.exists(custom_dictionary_path):
             try:
+                # One read and one upper() for the whole file, then split
                 with open(custom_dictionary_path, 'r') as f:
-                    self.custom_words = {line.strip().upper() for line in f if line.strip() and 3 <= len(line.strip()) <= 15}
+                    entries = (line.strip() for line in f.read().upper().splitlines())
+                    self.custom_words = {entry for entry in entries if 3 <= len(entry) <= 15}
                 logger.debug(f"Loaded {len(self.custom_words)} custom words")
             except Exception as e:
                 logger.error(f"Error loading custom dictionary: {e}")
+                
+        # Every accepted word in one set, so validation is a single lookup
+        self._word_set = frozenset(self.nltk_words | self.custom_words)
+        
+        # Per-word letter counts for get_valid_words, built on first use
+        self._dictionary_words: Optional[np.ndarray] = None
+        self._letter_counts: Optional[np.ndarray] = None
+        self._packed_counts: Optional[np.ndarray] = None
+        self._word_lengths: Optional[np.ndarray] = None
+        self._letter_masks: Optional[np.ndarray] = None
+        
+        # Lookup results by the caller's spelling; the dictionary never changes
+        # after this point, so entries never go stale
+        self._lookup_word = functools.lru_cache(maxsize=VALID_WORD_CACHE_SIZE)(self._lookup_word_uncached)
+        
+        # Sorted copies of each dictionary for prefix searches, built on first use
+        self._sorted_nltk_words: Optional[Sequence[str]] = None
+        self._sorted_custom_words: Optional[Sequence[str]] = None
         
     def is_valid_word(self, word: str) -> bool:
         """Check if a word is valid using NLTK and/or custom dictionary.
         
+        This is a pure lookup; word usage is recorded with record_usage.
+        
         Args:
             word: The word to validate
             
@@ -60,34 +203,177 @@ class WordValidator:
         """
         if not word or not isinstance(word, str):
             return False
+        return self._lookup_word(word) is not None
+        
+    def _lookup_word_uncached(self, word: str) -> Optional[str]:
+        """Normalize a word and look it up in the dictionary; wrapped by _lookup_word.
+        
+        Args:
+            word: The word as given by the caller
             
+        Returns:
+            The uppercased word if it is valid, otherwise None
+        """
         word = word.upper()
         if not word.isalpha() or not 3 <= len(word) <= 15:
+            return None
+        return word if word in self._word_set else None
+        
+    def record_usage(self, word: str, word_repo: Optional[WordRepository] = None) -> bool:
+        """Buffer a use of a word a player submitted, if it is valid.
+        
+        Words are counted in the repository's frequency only through this
+        method; validation and lookups by the analyzer, scoring or AI do not
+        count as uses. Uses are written in batches, so call flush_usage or
+        close when done with a validator built directly.
+        
+        Args:
+            word: The submitted word
+            word_repo: Repository to record in; defaults to this validator's
+            
+        Returns:
+            bool: True if the word was valid and its use was buffered
+        """
+        word_repo = word_repo if word_repo is not None else self.word_repo
+        valid_word = self._lookup_word(word) if word and isinstance(word, str) else None
+        if valid_word is None or word_repo is None:
             return False
             
-        is_valid = False
-        
-        if self.use_nltk:
-            is_valid = word in self.nltk_words
-            logger.debug(f"NLTK validation for {word}: {is_valid} (nltk_words: {len(self.nltk_words)})")
-                
-        if not is_valid and self.custom_words:
-            is_valid = word in self.custom_words
-            logger.debug(f"Custom validation for {word}: {is_valid} (custom_words: {len(self.custom_words)})")
+        pending = self._pending_usage.setdefault(id(word_repo), (word_repo, {}))[1]
+        pending[valid_word] = pending.get(valid_word, 0) + 1
+        self._pending_use_count += 1
+        if self._pending_use_count >= USAGE_FLUSH_THRESHOLD:
+            self.flush_usage()
+        return True
+
+    def flush_usage(self) -> None:
+        """Write the buffered word uses to their repositories, one batch each."""
+        if not self._pending_usage:
+            return
             
-        # Only record word usage if it's valid
-        if is_valid:
+        pending_by_repo, self._pending_usage = self._pending_usage, {}
+        self._pending_use_count = 0
+        for word_repo, pending in pending_by_repo.values():
             try:
-                self.word_repo.add_word(word)
-                logger.debug(f"Recorded word usage: {word} (valid: {is_valid})")
+                word_repo.record_words(pending)
+                logger.debug("Recorded usage of %s words", len(pending))
             except Exception as e:
-                logger.error(f"Error recording word usage for {word}: {e}")
+                logger.error("Error recording word usage: %s", e)
+
+    def close(self) -> None:
+        """Write any buffered word uses; the validator stays usable."""
+        self.flush_usage()
+
+    def _build_letter_counts(self) -> None:
+        """Build the A-Z letter count matrix and letter-set bitmasks for the dictionary."""
+        words = sorted(word for word in self._word_set if word.isascii() and word.isalpha())
+        lengths = np.fromiter((len(word) for word in words), dtype=np.intp, count=len(words))
+        letters = np.frombuffer("".join(words).encode('ascii'), dtype=np.uint8).astype(np.intp) - ord('A')
+        rows = np.repeat(np.arange(len(words)), lengths)
+        counts = np.bincount(rows * ALPHABET_SIZE + letters, minlength=len(words) * ALPHABET_SIZE)
+        
+        self._dictionary_words = np.array(words, dtype=object)
+        self._letter_counts = np.zeros((len(words), PACKED_COUNT_BYTES), dtype=np.uint8)
+        self._letter_counts[:, :ALPHABET_SIZE] = counts.reshape(len(words), ALPHABET_SIZE)
+        # The same rows read as four uint64 lanes each, for _formable
+        self._packed_counts = self._letter_counts.view(np.uint64)
+        self._word_lengths = lengths
+        # Bit i set when letter i occurs in the word
+        bits = np.left_shift(np.uint32(1), np.arange(ALPHABET_SIZE, dtype=np.uint32))
+        self._letter_masks = np.bitwise_or.reduce(
+            np.where(self._letter_counts[:, :ALPHABET_SIZE] > 0, bits, np.uint32(0)), axis=1
+        ).astype(np.uint32)
+
+    def _formable(self, candidates: np.ndarray, available: np.ndarray) -> np.ndarray:
+        """Check candidate words against the available letter counts.
+        
+        Compares all 26 counts of a word in four uint64 operations: with the
+        top bit of every available-count byte set, subtracting the word's
+        count bytes leaves that bit set exactly where the pool has enough of
+        the letter. Counts stay below 128 (words are at most 15 letters), so
+        no byte borrows from its neighbour.
+        
+        Args:
+            candidates: Indices of the words to check
+            available: Available count per letter, A-Z
             
-        return is_valid
+        Returns:
+            Boolean array, True where the word can be formed
+        """
+        pool = np.zeros(PACKED_COUNT_BYTES, dtype=np.uint8)
+        pool[:ALPHABET_SIZE] = np.minimum(available, 127)
+        lanes = (pool.view(np.uint64) | HIGH_BITS) - self._packed_counts[candidates]
+        return np.bitwise_and.reduce(lanes & HIGH_BITS, axis=1) == HIGH_BITS
+
+    def get_valid_words(self, letters: List[str], min_length: int = 3) -> Set[str]:
+        """Get every dictionary word that can be formed from the given letters.
+        
+        Each letter can be used as many times as it appears in letters. The
+        whole dictionary is first filtered to words whose letter set is
+        covered by the pool, using one bitmask test per word, and only those
+        candidates are checked against the available letter counts, a few
+        integer operations per word. Only words made of A-Z are considered.
+        
+        Args:
+            letters: Available letters (may contain duplicates)
+            min_length: Minimum length of returned words
+            
+        Returns:
+            Set of formable dictionary words
+            
+        Raises:
+            ValueError: If an item of letters is not a single character
+        """
+        if self._letter_counts is None:
+            self._build_letter_counts()
+            
+        available = np.zeros(ALPHABET_SIZE, dtype=np.intp)
+        available_mask = 0
+        for letter in letters:
+            if not isinstance(letter, str) or len(letter) != 1:
+                raise ValueError(f"Letters must be single characters, got {letter!r}")
+            index = ord(letter.upper()) - ord('A')
+            if 0 <= index < ALPHABET_SIZE:
+                available[index] += 1
+                available_mask |= 1 << index
+                
+        missing = np.uint32(~available_mask & ((1 << ALPHABET_SIZE) - 1))
+        candidates = np.flatnonzero(
+            ((self._letter_masks & missing) == 0) & (self._word_lengths >= min_length)
+        )
+        formable = self._formable(candidates, available)
+        return set(self._dictionary_words[candidates[formable]].tolist())
+
+    @staticmethod
+    def _words_with_prefix(sorted_words: Sequence[str], prefix: str, limit: int) -> List[str]:
+        """Get up to limit words starting with prefix from a sorted list.
+        
+        Words sharing a prefix are contiguous in sorted order, so the run is
+        found with one binary search and read until the first non-match.
+        
+        Args:
+            sorted_words: Words in sorted order
+            prefix: The prefix to search for
+            limit: Maximum number of words to return
+            
+        Returns:
+            Matching words in sorted order
+        """
+        matches = []
+        index = bisect.bisect_left(sorted_words, prefix)
+        while index < len(sorted_words) and len(matches) < limit:
+            word = sorted_words[index]
+            if not word.startswith(prefix):
+                break
+            matches.append(word)
+            index += 1
+        return matches
 
     def get_word_suggestions(self, prefix: str, max_suggestions: int = 10) -> List[str]:
         """Get word suggestions starting with the given prefix.
         
+        NLTK words come first, then custom words, each in alphabetical order.
+        
         Args:
             prefix: The prefix to search for
             max_suggestions: Maximum number of suggestions to return
@@ -102,28 +388,30 @@ class WordValidator:
         suggestions = []
         
         if self.use_nltk:
-            for word in self.nltk_words:
-                if word.startswith(prefix):
-                    suggestions.append(word)
-                    if len(suggestions) >= max_suggestions:
-                        break
+            if self._sorted_nltk_words is None:
+                # frozenset() returns the shared set itself, so every validator
+                # loaded from the same corpus reuses one sorted copy
+                self._sorted_nltk_words = _sorted_words(frozenset(self.nltk_words))
+            suggestions.extend(self._words_with_prefix(self._sorted_nltk_words, prefix, max_suggestions))
                 
         if len(suggestions) < max_suggestions and self.custom_words:
-            for word in self.custom_words:
-                if word.startswith(prefix):
-                    suggestions.append(word)
-                    if len(suggestions) >= max_suggestions:
-                        break
+            if self._sorted_custom_words is None:
+                self._sorted_custom_words = sorted(self.custom_words)
+            suggestions.extend(self._words_with_prefix(
+                self._sorted_custom_words, prefix, max_suggestions - len(suggestions)
+            ))
                         
         return suggestions
 
     def get_dictionary_stats(self) -> dict:
         """Get statistics about the dictionary."""
+        # Usage stats come from the repository, so include buffered uses
+        self.flush_usage()
         stats = {
             'total_words': 0,
             'max_length': 0,
             'min_length': 0,
-            'usage_stats': self.word_repo.get_word_stats()
+            'usage_stats': self.word_repo.get_word_stats() if self.word_repo is not None else None
         }
         
         if self.use_nltk:
@@ -153,27 +441,17 @@ class WordValidator:
         if not word or not isinstance(word, str):
             return False
             
-        word = word.upper()
-        if not word.isalpha() or not 3 <= len(word) <= 15:
-            return False
-            
         # First check if the word is valid
-        if not self.is_valid_word(word):
+        word = self._lookup_word(word)
+        if word is None:
             return False
             
-        # Then check if word can be formed using available letters
-        word_letters = {}
-        for letter in word:
-            word_letters[letter] = word_letters.get(letter, 0) + 1
-            
-        available_letters_dict = {}
-        for letter in available_letters:
-            letter = letter.upper()
-            available_letters_dict[letter] = available_letters_dict.get(letter, 0) + 1
-            
-        for letter, count in word_letters.items():
-            if letter not in available_letters_dict or available_letters_dict[letter] < count:
-                logger.debug(f"Letter {letter} not available or insufficient count")
+        # Then check if word can be formed using available letters; str.count
+        # tallies each distinct letter in C instead of building two dicts
+        pool = ''.join(available_letters).upper()
+        for letter in set(word):
+            if word.count(letter) > pool.count(letter):
+                logger.debug("Letter %s not available or insufficient count", letter)
                 return False
                 
         return True
@@ -187,4 +465,73 @@ class WordValidator:
         Returns:
             bool: True if the word is valid
         """
-        return self.is_valid_word(word)
\ No newline at end of file
+        return self.is_valid_word(word)
+
+
+# Validators shared by get_validator, keyed by dictionary configuration
+_shared_validators: Dict[Tuple[bool, Optional[str]], WordValidator] = {}
+# Held while a shared validator is built, so callers wait for an in-progress load
+_shared_validators_lock = threading.Lock()
+
+def get_validator(word_repo: WordRepository, use_nltk: bool = True, custom_dictionary_path: Optional[str] = None) -> WordValidator:
+    """Get the shared WordValidator for a dictionary configuration, creating it on first use.
+    
+    Loading the dictionaries is the expensive part of a WordValidator, so
+    components share one instance instead of each holding a copy. The word
+    repository passed on the first call is the validator's default; callers
+    with another repository pass it to record_usage, which buffers uses per
+    repository. Buffered uses are written by flush_validators, which also
+    runs at exit. If preload_validator is still loading the validator, this
+    waits for it.
+    
+    Args:
+        word_repo: Repository for word usage data
+        use_nltk: Whether to use NLTK for word validation
+        custom_dictionary_path: Path to a custom dictionary file
+        
+    Returns:
+        The shared WordValidator
+    """
+    key = (use_nltk, custom_dictionary_path)
+    with _shared_validators_lock:
+        validator = _shared_validators.get(key)
+        if validator is None:
+            validator = WordValidator(word_repo, use_nltk, custom_dictionary_path)
+            _shared_validators[key] = validator
+    return validator
+
+def flush_validators() -> None:
+    """Write the buffered word uses of every shared validator.
+    
+    Call this before closing the database the repositories use; it also
+    runs at exit for anything recorded since.
+    """
+    with _shared_validators_lock:
+        validators = list(_shared_validators.values())
+    for validator in validators:
+        validator.flush_usage()
+
+atexit.register(flush_validators)
+
+def preload_validator(word_repo: WordRepository, use_nltk: bool = True, custom_dictionary_path: Optional[str] = None) -> threading.Thread:
+    """Start building the shared WordValidator in a background thread.
+    
+    Lets startup work continue while the dictionaries load; the first
+    get_validator call with the same configuration picks up the result.
+    
+    Args:
+        word_repo: Repository for word usage data
+        use_nltk: Whether to use NLTK for word validation
+        custom_dictionary_path: Path to a custom dictionary file
+        
+    Returns:
+        The started loader thread
+    """
+    thread = threading.Thread(
+        target=get_validator,
+        args=(word_repo, use_nltk, custom_dictionary_path),
+        name="word-validator-preload",
+        daemon=True
+    )
+    thread.start()
+    return thread
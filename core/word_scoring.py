@@ -1,9 +1,10 @@
 # core/word_scoring.py
 # Scores words based on rarity and length, with progressive penalty for repeated use.
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
+import functools
 import logging
-from collections import Counter
+import numpy as np
 from core.letter_pool import WEIGHTED_ALPHABET
 from core.validation.word_validator import WordValidator
 from database.repositories.word_repository import WordRepository
@@ -11,14 +12,35 @@ from database.manager import DatabaseManager
 
 logger = logging.getLogger(__name__)
 
-# Build a basic frequency map from the weighted alphabet
-_letter_frequencies = Counter(WEIGHTED_ALPHABET)
-max_freq = max(_letter_frequencies.values())  # Highest possible frequency
+# Build a basic frequency table from the weighted alphabet, indexed by byte value
+_letter_frequencies = np.bincount(
+    np.frombuffer("".join(WEIGHTED_ALPHABET).upper().encode('ascii'), dtype=np.uint8), minlength=256
+)
+max_freq = int(_letter_frequencies.max())  # Highest possible frequency
+# Inverse frequency score per byte value; 0 for bytes that are not alphabet letters
+SCORE_LUT = np.where(_letter_frequencies > 0, np.maximum(1, max_freq - _letter_frequencies + 1), 0).astype(np.int32)
 letter_score_map = {
-    letter: max(1, (max_freq - count + 1))  # Inverse frequency scoring
-    for letter, count in _letter_frequencies.items()
+    chr(code): int(SCORE_LUT[code]) for code in np.flatnonzero(SCORE_LUT)
 }
 
+# Bonus points for using less common letters
+LETTER_SCORES = {
+    'e': 1, 'a': 1, 'i': 1, 'o': 1, 'n': 1, 'r': 1, 't': 1, 'l': 1, 's': 1,
+    'd': 2, 'g': 2, 'b': 3, 'c': 3, 'm': 3, 'p': 3,
+    'f': 4, 'h': 4, 'v': 4, 'w': 4, 'y': 4,
+    'k': 5,
+    'j': 8, 'x': 8,
+    'q': 10, 'z': 10
+}
+
+# LETTER_SCORES as a 256-entry byte table for bytes.translate, covering both
+# cases; every other byte scores 0
+_letter_score_table = bytearray(256)
+for _letter, _score in LETTER_SCORES.items():
+    _letter_score_table[ord(_letter)] = _score
+    _letter_score_table[ord(_letter.upper())] = _score
+LETTER_SCORE_TABLE = bytes(_letter_score_table)
+
 class WordScorer:
     """Handles word scoring and statistics."""
     
@@ -64,46 +86,85 @@ class WordScorer:
                 'is_valid': False
             }
 
-def score_word(word: str, word_validator: WordValidator, category: Optional[str] = None) -> int:
+@functools.cache
+def _get_default_validator() -> WordValidator:
+    """
+    Create the validator used when a caller passes none, on first use.
+    
+    It records no usage, and its NLTK word set is the one shared by every
+    validator in the process.
+    
+    Returns:
+        The default WordValidator
+    """
+    return WordValidator(use_nltk=True)
+
+def score_word(word: str, word_validator: Optional[WordValidator] = None, category: Optional[str] = None) -> int:
     """
     Calculate the score for a word based on various factors.
     
     Args:
         word: The word to score
-        word_validator: Validator instance to check word validity
+        word_validator: Validator instance to check word validity; defaults
+            to a dictionary-only validator created on first use
         category: Optional category to check against (currently unused)
         
     Returns:
         Score for the word, or 0 if invalid
     """
+    if word_validator is None:
+        word_validator = _get_default_validator()
     if not word_validator.validate_word(word):
         return 0
         
     # Base score is the length of the word
-    score = len(word)
-    
-    # Bonus points for using less common letters
-    letter_scores = {
-        'e': 1, 'a': 1, 'i': 1, 'o': 1, 'n': 1, 'r': 1, 't': 1, 'l': 1, 's': 1,
-        'd': 2, 'g': 2, 'b': 3, 'c': 3, 'm': 3, 'p': 3,
-        'f': 4, 'h': 4, 'v': 4, 'w': 4, 'y': 4,
-        'k': 5,
-        'j': 8, 'x': 8,
-        'q': 10, 'z': 10
-    }
+    length = len(word)
+    score = length
     
-    for letter in word.lower():
-        if letter in letter_scores:
-            score += letter_scores[letter]
+    # Bonus points for using less common letters, looked up and summed in C
+    score += sum(word.encode('utf-8').translate(LETTER_SCORE_TABLE))
             
-    # Bonus for word length
-    if len(word) >= 7:
+    # Bonus for word length (x1.5 rounded down, kept in integer arithmetic)
+    if length >= 7:
         score *= 2
-    elif len(word) >= 5:
-        score = int(score * 1.5)
+    elif length >= 5:
+        score = score * 3 // 2
         
     return score
 
+def score_words(words: Sequence[str], word_validator: Optional[WordValidator] = None) -> np.ndarray:
+    """
+    Calculate score_word for many words at once.
+    
+    Validity is still checked per word, but the letter bonuses are looked
+    up for all words in one translate and summed per word with
+    np.add.reduceat, and the length bonuses are applied array-wide.
+    
+    Args:
+        words: Words to score
+        word_validator: Validator instance to check word validity; defaults
+            to the same validator as score_word
+        
+    Returns:
+        Array of scores, in the order of words, with 0 for invalid words
+    """
+    if word_validator is None:
+        word_validator = _get_default_validator()
+    scores = np.zeros(len(words), dtype=np.int64)
+    valid = [index for index, word in enumerate(words) if word and word_validator.validate_word(word)]
+    if not valid:
+        return scores
+        
+    encoded = [words[index].encode('utf-8') for index in valid]
+    byte_lengths = np.fromiter(map(len, encoded), dtype=np.intp, count=len(encoded))
+    starts = np.concatenate(([0], np.cumsum(byte_lengths)[:-1]))
+    bonuses = np.frombuffer(b"".join(encoded).translate(LETTER_SCORE_TABLE), dtype=np.uint8)
+    
+    lengths = np.fromiter((len(words[index]) for index in valid), dtype=np.int64, count=len(valid))
+    totals = lengths + np.add.reduceat(bonuses.astype(np.int64), starts)
+    scores[valid] = np.where(lengths >= 7, totals * 2, np.where(lengths >= 5, totals * 3 // 2, totals))
+    return scores
+
 def get_word_stats(word: str, word_repo: WordRepository) -> Dict:
     """
     Get statistics for a word.
@@ -1,153 +1,521 @@
 # src/database/manager.py
-from typing import Optional, Any
-from sqlite3 import Connection, Cursor, connect
+from typing import Optional, Any, Iterable, Iterator
+from sqlite3 import Connection, Cursor, Error, Row, connect, register_adapter
+from datetime import datetime
 from contextlib import contextmanager
+import functools
+import itertools
 import logging
 import os
+import queue
+import threading
+
+# Applied once to each pooled connection; WAL with synchronous=NORMAL avoids an
+# fsync per commit, and the cache and mmap sizes keep hot pages in memory
+CONNECTION_PRAGMAS = {
+    "foreign_keys": "ON",
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "temp_store": "MEMORY",
+    "cache_size": -64000,
+    "mmap_size": 268435456,
+}
+
+# Compiled statements kept per connection; repository SQL text is reused verbatim
+STATEMENT_CACHE_SIZE = 256
+
+# Bound parameters per multi-row INSERT, under SQLite's historical limit of 999
+MAX_BULK_VARIABLES = 900
+
+# Rows per multi-row INSERT, unless that would bind too many parameters
+BULK_INSERT_CHUNK = 500
+
+# Connections kept by each DatabaseManager; in WAL mode readers on separate
+# connections run concurrently, and writers queue on SQLite's write lock
+POOL_SIZE = 4
+
+# Connections use no detect_types, so TIMESTAMP columns come back as str, not
+# datetime. Bound datetimes are stored as "YYYY-MM-DD HH:MM:SS", followed by
+# ".ffffff" when the microseconds are nonzero. That is SQLite's own layout,
+# which its date functions accept, and it orders correctly against
+# CURRENT_TIMESTAMP and datetime('now') when compared as text.
+# Registering the adapter also avoids the deprecated built-in one.
+register_adapter(datetime, lambda value: value.isoformat(" "))
+
+SCHEMA_PATH = os.path.join(os.path.dirname(__file__), 'schema.sql')
+
+@functools.lru_cache(maxsize=1)
+def _read_schema_sql() -> str:
+    """Read schema.sql once per process."""
+    with open(SCHEMA_PATH, 'r') as f:
+        return f.read()
+
+@functools.lru_cache(maxsize=STATEMENT_CACHE_SIZE)
+def _insert_kind(query: str) -> tuple[bool, bool]:
+    """Classify a statement once per SQL text.
+    
+    Args:
+        query: SQL text as passed to execute
+        
+    Returns:
+        Whether the statement is an INSERT, and whether it has a RETURNING clause
+    """
+    upper = query.upper()
+    return upper.lstrip().startswith('INSERT'), 'RETURNING' in upper
+
+@functools.lru_cache(maxsize=STATEMENT_CACHE_SIZE)
+def _multi_row_insert_sql(table: str, columns: tuple[str, ...], row_count: int) -> str:
+    """Build an INSERT of row_count rows, reused for every full chunk of a bulk insert."""
+    row_placeholders = f"({', '.join(['?' for _ in columns])})"
+    return f"INSERT INTO {table} ({', '.join(columns)}) VALUES {', '.join([row_placeholders] * row_count)}"
+
+def _drop_tables_script(cursor: Cursor) -> str:
+    """Build one script dropping every user table.
+    
+    Args:
+        cursor: Cursor on the database to inspect
+        
+    Returns:
+        DROP TABLE statements, one per table
+    """
+    cursor.execute("""
+        SELECT name FROM sqlite_master 
+        WHERE type='table' AND name NOT LIKE 'sqlite_%'
+    """)
+    return "".join(f'DROP TABLE IF EXISTS "{row[0]}";\n' for row in cursor.fetchall())
+
+def _begin(conn: Connection, mode: str = "DEFERRED") -> None:
+    """Open a transaction unless one is already open.
+    
+    Connections run with isolation_level=None, so the driver never begins
+    or commits on its own and every transaction starts here.
+    
+    Args:
+        conn: Connection to begin on
+        mode: DEFERRED, IMMEDIATE or EXCLUSIVE
+    """
+    if not conn.in_transaction:
+        conn.execute(f"BEGIN {mode}")
+
+def _commit(conn: Connection) -> None:
+    """Commit the open transaction, if any."""
+    if conn.in_transaction:
+        conn.execute("COMMIT")
+
+def _rollback(conn: Connection) -> None:
+    """Roll back the open transaction, if any."""
+    if conn.in_transaction:
+        conn.execute("ROLLBACK")
+
+def _execute_without_foreign_keys(conn: Connection, statements: str) -> None:
+    """Run statements as one script and transaction with foreign keys off.
+    
+    Foreign key enforcement can only be switched outside a transaction, so it
+    is turned off before BEGIN and back on afterwards, even if the script fails.
+    
+    Args:
+        conn: Connection to run the script on
+        statements: SQL statements, without BEGIN or COMMIT
+        
+    Raises:
+        RuntimeError: If a transaction is already open on conn
+    """
+    # The PRAGMA is ignored inside a transaction, and committing the open one
+    # here would commit work that belongs to the caller
+    if conn.in_transaction:
+        raise RuntimeError("Foreign keys cannot be switched inside an open transaction")
+    cursor = conn.cursor()
+    cursor.execute("PRAGMA foreign_keys = OFF")
+    try:
+        cursor.executescript("BEGIN;\n" + statements + "\nCOMMIT;")
+    finally:
+        _rollback(conn)
+        cursor.execute("PRAGMA foreign_keys = ON")
+
+class _ConnectionPool:
+    """Fixed-size pool of configured connections, opened on demand.
+    
+    Idle connections are handed out most recently used first, so a single
+    thread keeps getting the same connection with warm caches.
+    """
+    def __init__(self, db_path: str, size: int = POOL_SIZE, pragmas: Optional[dict[str, Any]] = None):
+        self.db_path = db_path
+        self.size = size
+        self.pragmas = {**CONNECTION_PRAGMAS, **(pragmas or {})}
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._connections: list[Connection] = []
+        # Connections handed out by acquire() and not yet released
+        self._checked_out: set[Connection] = set()
+        self._lock = threading.Lock()
+        
+    def _open(self) -> Connection:
+        """Open a connection with the pool's PRAGMAs applied."""
+        # Used from whichever thread checks it out, one thread at a time.
+        # Transactions are begun and ended explicitly by DatabaseManager.
+        conn = connect(self.db_path, check_same_thread=False, isolation_level=None,
+                       cached_statements=STATEMENT_CACHE_SIZE)
+        for name, value in self.pragmas.items():
+            conn.execute(f"PRAGMA {name} = {value}")
+        return conn
+        
+    @staticmethod
+    def _close_connection(conn: Connection) -> None:
+        """Close a connection, first running PRAGMA optimize.
+        
+        PRAGMA optimize re-analyzes only the tables whose statistics the
+        connection's queries found stale.
+        """
+        try:
+            conn.execute("PRAGMA optimize")
+        except Error:
+            pass  # Closing matters more than fresher statistics
+        conn.close()
+        
+    def acquire(self) -> Connection:
+        """Take an idle connection, opening one if the pool is not full yet.
+        
+        Blocks while all connections are in use.
+        """
+        with self._lock:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                conn = None
+                if len(self._connections) < self.size:
+                    conn = self._open()
+                    self._connections.append(conn)
+            if conn is not None:
+                self._checked_out.add(conn)
+                return conn
+        conn = self._idle.get()
+        with self._lock:
+            self._checked_out.add(conn)
+        return conn
+        
+    def release(self, conn: Connection) -> None:
+        """Return a connection taken with acquire().
+        
+        Connections checked out when close() ran are closed here instead of
+        going back to the idle queue.
+        """
+        with self._lock:
+            self._checked_out.discard(conn)
+            owned = any(conn is pooled for pooled in self._connections)
+        if owned:
+            self._idle.put(conn)
+        else:
+            self._close_connection(conn)
+        
+    def close(self) -> None:
+        """Close every idle connection; checked-out ones close when released."""
+        with self._lock:
+            for conn in self._connections:
+                if conn not in self._checked_out:
+                    self._close_connection(conn)
+            self._connections.clear()
+            self._idle = queue.LifoQueue()
 
 class DatabaseManager:
-    def __init__(self, db_path: str):
-        """Initialize the database manager with the SQLite database path."""
+    def __init__(self, db_path: str, pragmas: Optional[dict[str, Any]] = None):
+        """Initialize the database manager with the SQLite database path.
+        
+        Args:
+            db_path: Path to the SQLite database file
+            pragmas: PRAGMA values that replace or extend CONNECTION_PRAGMAS,
+                e.g. {"synchronous": "OFF"} for throwaway test databases
+        """
         self.db_path = db_path
         self.logger = logging.getLogger(__name__)
-        self.conn = None
+        # Long-lived connections behind get_connection, opened on first use
+        self._pool = _ConnectionPool(db_path, pragmas=pragmas)
+        # Connection the current thread has checked out; nested blocks join its
+        # transaction. with_blocks records, per open with-block, whether it
+        # acquired that connection.
+        self._local = threading.local()
+        # Result column names per query text; cleared whenever the schema may change
+        self._columns_by_query: dict[str, list[str]] = {}
         self.initialize_database()
         
+    @property
+    def conn(self) -> Optional[Connection]:
+        """The connection of the current thread's with-block, or None outside one."""
+        if getattr(self._local, 'with_blocks', None):
+            return self._local.conn
+        return None
+        
     def __enter__(self):
-        """Enter the context manager."""
-        if not self.conn:
-            self.conn = connect(self.db_path)
-            self.conn.execute("PRAGMA foreign_keys = ON")
+        """Enter the context manager, holding one pooled connection for the whole block.
+        
+        Operations the thread runs inside the block share that connection and
+        are committed together when it ends; other threads keep using their
+        own pooled connections. A block opened inside a transaction() or
+        another with-block joins it. The pool stays open after the block;
+        call close() to shut it down.
+        """
+        if not hasattr(self._local, 'with_blocks'):
+            self._local.with_blocks = []
+        acquired = getattr(self._local, 'conn', None) is None
+        if acquired:
+            conn = self._pool.acquire()
+            _begin(conn)
+            self._local.conn = conn
+        self._local.with_blocks.append(acquired)
         return self
         
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Exit the context manager."""
-        if self.conn:
+        """Exit the context manager, committing or rolling back and releasing its connection."""
+        if not self._local.with_blocks.pop():
+            # Joined blocks leave the transaction to the one that began it
+            return
+        conn, self._local.conn = self._local.conn, None
+        try:
             if exc_type is not None:
-                self.conn.rollback()
+                _rollback(conn)
             else:
-                self.conn.commit()
-            self.conn.close()
-            self.conn = None
+                _commit(conn)
+        finally:
+            self._pool.release(conn)
             
     @contextmanager
     def get_connection(self) -> Connection:
-        """Get a database connection with automatic cleanup.
+        """Get a database connection, committing or rolling back when the block ends.
+        
+        Connections come from a small pool and are kept open between calls,
+        so SQLite's page and statement caches survive between operations.
+        Each block runs in one explicit BEGIN ... COMMIT. Nested calls in one
+        thread, and calls inside a transaction() block, join the outer
+        transaction and leave it to that block to commit.
         
         Yields:
-            sqlite3.Connection: A database connection that will be automatically closed.
+            sqlite3.Connection: A database connection
         """
-        if self.conn:
-            yield self.conn
-        else:
-            conn = connect(self.db_path)
-            try:
-                conn.execute("PRAGMA foreign_keys = ON")
-                yield conn
-                conn.commit()
-            except Exception as e:
-                conn.rollback()
-                self.logger.error(f"Database error: {str(e)}")
-                raise
-            finally:
-                conn.close()
+        held = getattr(self._local, 'conn', None)
+        if held is not None:
+            yield held
+            return
+            
+        conn = self._pool.acquire()
+        self._local.conn = conn
+        try:
+            _begin(conn)
+            yield conn
+            _commit(conn)
+        except Exception as e:
+            _rollback(conn)
+            self.logger.error("Database error: %s", e)
+            raise
+        except BaseException:
+            # GeneratorExit or KeyboardInterrupt: never pool an open BEGIN
+            _rollback(conn)
+            raise
+        finally:
+            self._local.conn = None
+            self._pool.release(conn)
                 
+    @contextmanager
+    def transaction(self) -> Connection:
+        """Run several operations in one BEGIN IMMEDIATE ... COMMIT.
+        
+        Repository calls made inside the block in the same thread share the
+        transaction, so the writes of one logical operation are committed
+        (and synced) once, or rolled back together if the block raises.
+        Nested blocks join the outermost one.
+        
+        Yields:
+            sqlite3.Connection: The connection running the transaction
+        """
+        held = getattr(self._local, 'conn', None)
+        if held is not None:
+            # The outer block, or with-block, commits when it ends
+            yield held
+            return
+            
+        conn = self._pool.acquire()
+        self._local.conn = conn
+        try:
+            # IMMEDIATE takes the write lock up front, so a later write in the
+            # block cannot fail to upgrade a read lock
+            _begin(conn, "IMMEDIATE")
+            yield conn
+            _commit(conn)
+        except BaseException:
+            _rollback(conn)
+            raise
+        finally:
+            self._local.conn = None
+            self._pool.release(conn)
+                
+    @contextmanager
+    def _dedicated_connection(self) -> Connection:
+        """Check out a pooled connection with no transaction open on it.
+        
+        Used for scripts, which sqlite3 runs after committing any open
+        transaction, so they must not run inside (and commit) the calling
+        thread's with-block or transaction().
+        
+        Yields:
+            sqlite3.Connection: A connection outside any transaction
+            
+        Raises:
+            RuntimeError: If the calling thread is inside a transaction
+        """
+        if getattr(self._local, 'conn', None) is not None:
+            raise RuntimeError("Cannot run a SQL script inside an open transaction")
+            
+        conn = self._pool.acquire()
+        self._local.conn = conn
+        try:
+            yield conn
+        finally:
+            self._local.conn = None
+            self._pool.release(conn)
+            
+    def _column_names(self, query: str, cursor: Cursor) -> list[str]:
+        """Get the result column names of a query that has just run on cursor.
+        
+        sqlite3 builds a new description tuple on every execute, so the names
+        are cached by query text rather than read from it each time.
+        """
+        columns = self._columns_by_query.get(query)
+        if columns is None:
+            columns = [description[0] for description in cursor.description]
+            self._columns_by_query[query] = columns
+        return columns
+        
     def execute_query(self, query: str, params: Optional[tuple] = None) -> list:
         """Execute a query and return the results as a list of dictionaries."""
-        if not self.conn:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(query, params or ())
-                if cursor.description:
-                    columns = [description[0] for description in cursor.description]
-                    return [dict(zip(columns, row)) for row in cursor.fetchall()]
-                if query.strip().upper().startswith('INSERT'):
-                    return [{'id': cursor.lastrowid}]
-                return []
-        else:
-            cursor = self.conn.cursor()
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
             cursor.execute(query, params or ())
             if cursor.description:
-                columns = [description[0] for description in cursor.description]
+                columns = self._column_names(query, cursor)
                 return [dict(zip(columns, row)) for row in cursor.fetchall()]
-            if query.strip().upper().startswith('INSERT'):
+            if _insert_kind(query)[0]:
                 return [{'id': cursor.lastrowid}]
             return []
             
+    def iter_query(self, query: str, params: Optional[tuple] = None) -> Iterator[dict]:
+        """Execute a query and yield the results one dictionary at a time.
+        
+        Rows are read from the cursor as they are consumed, so memory use does
+        not grow with the result size. Inside a with-block or transaction() the
+        query reads through that block's connection. Otherwise it runs on a
+        pooled connection of its own that is never registered for the thread,
+        so writes made while the loop is suspended commit on their own instead
+        of joining (and being rolled back with) the read. That connection
+        stays checked out until the generator is exhausted or closed.
+        """
+        held = getattr(self._local, 'conn', None)
+        if held is not None:
+            cursor = held.cursor()
+            cursor.execute(query, params or ())
+            columns = self._column_names(query, cursor)
+            for row in cursor:
+                yield dict(zip(columns, row))
+            return
+            
+        conn = self._pool.acquire()
+        try:
+            # One read snapshot for the whole iteration; nothing is written here
+            _begin(conn)
+            cursor = conn.cursor()
+            cursor.execute(query, params or ())
+            columns = self._column_names(query, cursor)
+            for row in cursor:
+                yield dict(zip(columns, row))
+        finally:
+            _rollback(conn)
+            self._pool.release(conn)
+                
+    def fetch_rows(self, query: str, params: Optional[tuple] = None) -> list[Row]:
+        """Execute a query and return the results as sqlite3.Row objects.
+        
+        Rows support row["column"] lookups through the cursor's shared column
+        names, so no dictionary is built per row. Use this for read-only
+        loops over large results; execute_query still returns plain dicts.
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = Row
+            cursor.execute(query, params or ())
+            return cursor.fetchall()
+            
     def execute(self, query: str, params: Optional[tuple] = None) -> Optional[int]:
         """Execute a query that doesn't return results."""
-        if not self.conn:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(query, params or ())
-                if query.strip().upper().startswith('INSERT'):
-                    if 'RETURNING' in query.upper():
-                        row = cursor.fetchone()
-                        return row[0] if row else None
-                    return cursor.lastrowid
-                return None
-        else:
-            cursor = self.conn.cursor()
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
             cursor.execute(query, params or ())
-            if query.strip().upper().startswith('INSERT'):
-                if 'RETURNING' in query.upper():
+            is_insert, returning = _insert_kind(query)
+            if is_insert:
+                if returning:
                     row = cursor.fetchone()
                     return row[0] if row else None
                 return cursor.lastrowid
             return None
             
-    def execute_many(self, query: str, params_list: list[tuple]) -> None:
-        """Execute a query multiple times with different parameters."""
-        if not self.conn:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.executemany(query, params_list)
-        else:
-            cursor = self.conn.cursor()
-            cursor.executemany(query, params_list)
+    def execute_many(self, query: str, params_list: Iterable[tuple]) -> None:
+        """Execute a query multiple times with different parameters.
+        
+        All rows are written in one BEGIN IMMEDIATE ... COMMIT. params_list
+        may be a generator, so large batches need not be built up front.
+        """
+        with self.transaction() as conn:
+            conn.cursor().executemany(query, params_list)
             
+    def bulk_insert(self, table: str, columns: list[str], rows: Iterable[tuple],
+                    chunk: int = BULK_INSERT_CHUNK) -> int:
+        """Insert rows with multi-row INSERT statements in one transaction.
+        
+        Each statement inserts up to chunk rows, so SQLite prepares and steps
+        one statement per chunk instead of one per row. Table and column
+        names are put into the SQL as given and must be trusted identifiers.
+        
+        Args:
+            table: Table to insert into
+            columns: Column names, in the order of each row's values
+            rows: Row value tuples; may be a generator
+            chunk: Maximum rows per statement, lowered if needed to stay
+                within MAX_BULK_VARIABLES parameters
+                
+        Returns:
+            The number of rows inserted
+        """
+        columns = tuple(columns)
+        chunk = max(1, min(chunk, MAX_BULK_VARIABLES // len(columns)))
+        rows = iter(rows)
+        inserted = 0
+        with self.transaction() as conn:
+            cursor = conn.cursor()
+            while batch := list(itertools.islice(rows, chunk)):
+                cursor.execute(_multi_row_insert_sql(table, columns, len(batch)),
+                               list(itertools.chain.from_iterable(batch)))
+                inserted += len(batch)
+        return inserted
+        
     def execute_script(self, script: str) -> None:
-        """Execute a SQL script containing multiple statements."""
-        if not self.conn:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.executescript(script)
-        else:
-            cursor = self.conn.cursor()
-            cursor.executescript(script)
+        """Execute a SQL script containing multiple statements.
+        
+        Raises:
+            RuntimeError: If called inside a with-block or transaction()
+        """
+        with self._dedicated_connection() as conn:
+            self._columns_by_query.clear()
+            conn.cursor().executescript(script)
             
     def get_one(self, query: str, params: Optional[tuple] = None) -> Optional[dict]:
         """Execute a query and return a single row as a dictionary."""
-        if not self.conn:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(query, params or ())
-                row = cursor.fetchone()
-                if row:
-                    columns = [description[0] for description in cursor.description]
-                    return dict(zip(columns, row))
-                return None
-        else:
-            cursor = self.conn.cursor()
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
             cursor.execute(query, params or ())
             row = cursor.fetchone()
             if row:
-                columns = [description[0] for description in cursor.description]
-                return dict(zip(columns, row))
+                return dict(zip(self._column_names(query, cursor), row))
             return None
             
     def get_scalar(self, query: str, params: Optional[tuple] = None) -> Optional[Any]:
         """Execute a query and return a single scalar value."""
-        if not self.conn:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(query, params or ())
-                row = cursor.fetchone()
-                return row[0] if row else None
-        else:
-            cursor = self.conn.cursor()
-            cursor.execute(query, params or ())
-            row = cursor.fetchone()
+        with self.get_connection() as conn:
+            row = conn.execute(query, params or ()).fetchone()
             return row[0] if row else None
             
     def table_exists(self, table_name: str) -> bool:
@@ -159,39 +527,25 @@ class DatabaseManager:
         return bool(self.get_scalar(query, (table_name,)))
             
     def drop_tables(self) -> None:
-        """Drop all tables in the database."""
-        if not self.conn:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT name FROM sqlite_master 
-                    WHERE type='table' AND name NOT LIKE 'sqlite_%'
-                """)
-                tables = [row[0] for row in cursor.fetchall()]
-                for table in tables:
-                    cursor.execute(f"DROP TABLE IF EXISTS {table}")
-        else:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                SELECT name FROM sqlite_master 
-                WHERE type='table' AND name NOT LIKE 'sqlite_%'
-            """)
-            tables = [row[0] for row in cursor.fetchall()]
-            for table in tables:
-                cursor.execute(f"DROP TABLE IF EXISTS {table}")
+        """Drop all tables in the database in a single script and transaction.
+        
+        Foreign keys are off while dropping, so no cascades or constraint
+        checks run for rows that are about to go anyway.
+        """
+        with self._dedicated_connection() as conn:
+            self._columns_by_query.clear()
+            _execute_without_foreign_keys(conn, _drop_tables_script(conn.cursor()))
                 
+    def analyze(self) -> None:
+        """Gather table and index statistics for the query planner."""
+        with self.get_connection() as conn:
+            conn.execute("ANALYZE")
+            
     def create_tables(self) -> None:
         """Create all necessary database tables if they don't exist."""
         try:
-            if not self.conn:
-                with self.get_connection() as conn:
-                    cursor = conn.cursor()
-                    cursor.execute("PRAGMA foreign_keys = ON")
-                    self.execute_schema_file()
-            else:
-                cursor = self.conn.cursor()
-                cursor.execute("PRAGMA foreign_keys = ON")
-                self.execute_schema_file()
+            self.execute_schema_file()
+            self.analyze()
             self.logger.info("Database tables created successfully")
         except Exception as e:
             self.logger.error(f"Error creating tables: {str(e)}")
@@ -200,19 +554,11 @@ class DatabaseManager:
     def execute_schema_file(self) -> None:
         """Execute the schema.sql file to create all tables, indexes, and triggers."""
         try:
-            schema_path = os.path.join(os.path.dirname(__file__), 'schema.sql')
-            with open(schema_path, 'r') as f:
-                schema_sql = f.read()
+            schema_sql = _read_schema_sql()
+            self._columns_by_query.clear()
 
-            if not self.conn:
-                with self.get_connection() as conn:
-                    cursor = conn.cursor()
-                    cursor.execute("PRAGMA foreign_keys = ON")
-                    cursor.executescript(schema_sql)
-            else:
-                cursor = self.conn.cursor()
-                cursor.execute("PRAGMA foreign_keys = ON")
-                cursor.executescript(schema_sql)
+            with self._dedicated_connection() as conn:
+                conn.cursor().executescript(schema_sql)
             self.logger.info("Schema file executed successfully")
         except Exception as e:
             self.logger.error(f"Error executing schema file: {str(e)}")
@@ -231,30 +577,10 @@ class DatabaseManager:
                 with self.get_connection() as conn:
                     pass
 
-            # Start a new connection for the initialization process
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                # Enable foreign keys
-                cursor.execute("PRAGMA foreign_keys = OFF")
-                
-                # Drop all existing tables
-                cursor.execute("""
-                    SELECT name FROM sqlite_master 
-                    WHERE type='table' AND name NOT LIKE 'sqlite_%'
-                """)
-                tables = [row[0] for row in cursor.fetchall()]
-                for table in tables:
-                    cursor.execute(f"DROP TABLE IF EXISTS {table}")
-                
-                # Execute the schema file to create tables
-                schema_path = os.path.join(os.path.dirname(__file__), 'schema.sql')
-                with open(schema_path, 'r') as f:
-                    schema_sql = f.read()
-                cursor.executescript(schema_sql)
-                
-                # Re-enable foreign keys
-                cursor.execute("PRAGMA foreign_keys = ON")
+            with self._dedicated_connection() as conn:
+                # Drop and recreate every table in one script and one transaction
+                self._columns_by_query.clear()
+                _execute_without_foreign_keys(conn, _drop_tables_script(conn.cursor()) + _read_schema_sql())
             
             self.logger.info("Database initialized successfully")
         except Exception as e:
@@ -302,7 +628,5 @@ class DatabaseManager:
         return WordUsageRepository(self)
         
     def close(self):
-        """Close the database connection."""
-        if self.conn:
-            self.conn.close()
-            self.conn = None
\ No newline at end of file
+        """Close the database connections; later operations open new ones."""
+        self._pool.close()
\ No newline at end of file
@@ -12,17 +12,85 @@ Key Features:
 - SQLite-specific optimizations
 - Transaction management through DatabaseManager
 - Type hints for better IDE support and code safety
+
+Each repository call commits on its own. To group the writes of one logical
+operation into a single transaction, make the calls inside
+DatabaseManager.transaction():
+
+    with db_manager.transaction():
+        game_repo.record_move(game_id, word, True)
+        word_repo.increment_frequency(word_id)
 """
 
-from typing import TypeVar, Generic, Optional, List, Dict, Any
+from typing import TypeVar, Generic, Optional, List, Dict, Any, Tuple, Iterator
 from ..manager import DatabaseManager
+import functools
 import logging
+import re
 from datetime import datetime, timedelta
 import sqlite3
 from contextlib import contextmanager
 
 T = TypeVar('T')
 
+# SQL text is cached per table and column tuple so repeated calls hand SQLite
+# the identical string, which its per-connection statement cache then reuses
+# without parsing and planning again; columns are validated on first use only
+SQL_CACHE_SIZE = 512
+
+# Table and column names are interpolated into SQL, so they must be plain identifiers
+_IDENT = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+def _check_identifiers(names: Tuple[str, ...]) -> None:
+    """Raise ValueError unless every name is a plain SQL identifier."""
+    for name in names:
+        if not isinstance(name, str) or not _IDENT.match(name):
+            raise ValueError(f"Invalid SQL identifier: {name!r}")
+
+def _where_clause(columns: Tuple[str, ...]) -> str:
+    """Build a WHERE clause matching each column to a placeholder."""
+    return f" WHERE {' AND '.join([f'{column} = ?' for column in columns])}" if columns else ""
+
+@functools.lru_cache(maxsize=SQL_CACHE_SIZE)
+def _build_insert_sql(table_name: str, columns: Tuple[str, ...]) -> str:
+    """Build an INSERT of one row with the given columns."""
+    _check_identifiers(columns)
+    return f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({', '.join(['?' for _ in columns])})"
+
+@functools.lru_cache(maxsize=SQL_CACHE_SIZE)
+def _build_upsert_sql(table_name: str, columns: Tuple[str, ...], conflict_columns: Tuple[str, ...],
+                      updates: Tuple[Tuple[str, str], ...]) -> str:
+    """Build an INSERT of one row that updates the existing row on a conflict instead."""
+    _check_identifiers(columns + conflict_columns + tuple(column for column, _ in updates))
+    assignments = ', '.join([f'{column} = {expression}' for column, expression in updates])
+    return (f"{_build_insert_sql(table_name, columns)} "
+            f"ON CONFLICT({', '.join(conflict_columns)}) DO UPDATE SET {assignments}")
+
+@functools.lru_cache(maxsize=SQL_CACHE_SIZE)
+def _build_select_sql(table_name: str, columns: Tuple[str, ...], limit_one: bool = False) -> str:
+    """Build a SELECT * matching the given columns, optionally limited to one row."""
+    _check_identifiers(columns)
+    return f"SELECT * FROM {table_name}{_where_clause(columns)}{' LIMIT 1' if limit_one else ''}"
+
+@functools.lru_cache(maxsize=SQL_CACHE_SIZE)
+def _build_count_sql(table_name: str, columns: Tuple[str, ...]) -> str:
+    """Build a SELECT COUNT(*) matching the given columns."""
+    _check_identifiers(columns)
+    return f"SELECT COUNT(*) FROM {table_name}{_where_clause(columns)}"
+
+@functools.lru_cache(maxsize=SQL_CACHE_SIZE)
+def _build_update_sql(table_name: str, columns: Tuple[str, ...], returning: bool = False) -> str:
+    """Build an UPDATE setting the given columns of the row with a given id, optionally returning it."""
+    _check_identifiers(columns)
+    return (f"UPDATE {table_name} SET {', '.join([f'{column} = ?' for column in columns])} WHERE id = ?"
+            f"{' RETURNING *' if returning else ''}")
+
+@functools.lru_cache(maxsize=SQL_CACHE_SIZE)
+def _build_delete_sql(table_name: str, columns: Tuple[str, ...]) -> str:
+    """Build a DELETE matching the given columns."""
+    _check_identifiers(columns)
+    return f"DELETE FROM {table_name}{_where_clause(columns)}"
+
 class BaseRepository(Generic[T]):
     """Base repository class providing common database operations."""
     
@@ -39,11 +107,18 @@ class BaseRepository(Generic[T]):
         """
         if not table_name:
             raise ValueError("table_name is required")
+        _check_identifiers((table_name,))
             
         self.db_manager = db_manager
         self.table_name = table_name
         self.logger = logging.getLogger(self.__class__.__name__)
         
+        # Statements that only depend on the table
+        self._sql_get_by_id = _build_select_sql(table_name, ('id',))
+        self._sql_get_all = _build_select_sql(table_name, ())
+        self._sql_delete = _build_delete_sql(table_name, ('id',))
+        self._sql_count = _build_count_sql(table_name, ())
+        
     @contextmanager
     def get_connection(self):
         """
@@ -55,6 +130,14 @@ class BaseRepository(Generic[T]):
         with self.db_manager.get_connection() as conn:
             yield conn
             
+    def _mark_modified(self) -> None:
+        """
+        Hook called after this repository writes to its table.
+        
+        Subclasses that expose a change token for caching override this.
+        """
+        pass
+            
     def create(self, data: Dict[str, Any]) -> int:
         """
         Create a new record in the table.
@@ -65,18 +148,120 @@ class BaseRepository(Generic[T]):
         Returns:
             The ID of the created record
         """
-        columns = ', '.join(data.keys())
-        placeholders = ', '.join(['?' for _ in data])
-        query = f"""
-            INSERT INTO {self.table_name} ({columns})
-            VALUES ({placeholders})
-        """
+        query = _build_insert_sql(self.table_name, tuple(data))
         
         with self.db_manager.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(query, tuple(data.values()))
+            self._mark_modified()
             return cursor.lastrowid
         
+    def bulk_create(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Create many records with one prepared INSERT in a single transaction.
+        
+        Args:
+            rows: Dictionaries of column names and values, all with the same columns
+            
+        Returns:
+            The number of records created
+            
+        Raises:
+            ValueError: If the rows do not all have the same columns
+        """
+        if not rows:
+            return 0
+            
+        columns = self._bulk_columns(rows)
+        query = _build_insert_sql(self.table_name, tuple(columns))
+        self.db_manager.execute_many(query, (tuple(row[column] for column in columns) for row in rows))
+        self._mark_modified()
+        return len(rows)
+        
+    def upsert(self, conflict_columns: List[str], data: Dict[str, Any], updates: Dict[str, str]) -> None:
+        """
+        Insert a record, or update the existing one if it conflicts, in one statement.
+        
+        Args:
+            conflict_columns: Columns of the UNIQUE constraint that detects the conflict
+            data: Dictionary of column names and values to insert
+            updates: Column names mapped to the SQL expressions assigned on a conflict;
+                excluded.<column> refers to the value that was being inserted.
+                Expressions are SQL text and must not contain caller input.
+        """
+        self.bulk_upsert(conflict_columns, [data], updates)
+        
+    def bulk_upsert(self, conflict_columns: List[str], rows: List[Dict[str, Any]],
+                    updates: Dict[str, str]) -> int:
+        """
+        Upsert many records with one prepared statement in a single transaction.
+        
+        Args:
+            conflict_columns: Columns of the UNIQUE constraint that detects the conflict
+            rows: Dictionaries of column names and values, all with the same columns
+            updates: Column names mapped to the SQL expressions assigned on a conflict
+            
+        Returns:
+            The number of records inserted or updated
+            
+        Raises:
+            ValueError: If the rows do not all have the same columns
+        """
+        if not rows:
+            return 0
+            
+        columns = self._bulk_columns(rows)
+        query = _build_upsert_sql(self.table_name, tuple(columns), tuple(conflict_columns),
+                                  tuple(updates.items()))
+        self.db_manager.execute_many(query, (tuple(row[column] for column in columns) for row in rows))
+        self._mark_modified()
+        return len(rows)
+        
+    def bulk_create_values(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Create many records with multi-row INSERT statements in a single transaction.
+        
+        Rows go through DatabaseManager.bulk_insert, so SQLite prepares and
+        steps one statement per chunk of rows instead of one per row.
+        
+        Args:
+            rows: Dictionaries of column names and values, all with the same columns
+            
+        Returns:
+            The number of records created
+            
+        Raises:
+            ValueError: If the rows do not all have the same columns
+        """
+        if not rows:
+            return 0
+            
+        columns = self._bulk_columns(rows)
+        _check_identifiers(tuple(columns))
+        self.db_manager.bulk_insert(self.table_name, columns,
+                                    (tuple(row[column] for column in columns) for row in rows))
+        self._mark_modified()
+        return len(rows)
+        
+    @staticmethod
+    def _bulk_columns(rows: List[Dict[str, Any]]) -> List[str]:
+        """
+        Get the shared columns of rows passed to a bulk insert.
+        
+        Args:
+            rows: Non-empty list of row dictionaries
+            
+        Returns:
+            The column names, in the order of the first row
+            
+        Raises:
+            ValueError: If the rows do not all have the same columns
+        """
+        keys = rows[0].keys()
+        if any(row.keys() != keys for row in rows):
+            raise ValueError("bulk insert rows must all have the same columns")
+        return list(keys)
+        
     def get_by_id(self, id: int) -> Optional[Dict[str, Any]]:
         """
         Get a record by its ID.
@@ -87,10 +272,7 @@ class BaseRepository(Generic[T]):
         Returns:
             The record as a dictionary, or None if not found
         """
-        query = f"""
-            SELECT * FROM {self.table_name}
-            WHERE id = ?
-        """
+        query = self._sql_get_by_id
         
         with self.db_manager.get_connection() as conn:
             cursor = conn.cursor()
@@ -108,13 +290,16 @@ class BaseRepository(Generic[T]):
         Returns:
             List of records as dictionaries
         """
-        query = f"SELECT * FROM {self.table_name}"
+        return list(self.iter_all())
         
-        with self.db_manager.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(query)
-            columns = [description[0] for description in cursor.description]
-            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+    def iter_all(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all records in the table without loading them at once.
+        
+        Yields:
+            Records as dictionaries
+        """
+        return self.db_manager.iter_query(self._sql_get_all)
         
     def update(self, id: int, data: Dict[str, Any]) -> bool:
         """
@@ -127,18 +312,41 @@ class BaseRepository(Generic[T]):
         Returns:
             True if the record was updated, False otherwise
         """
-        set_clause = ', '.join([f"{k} = ?" for k in data.keys()])
-        query = f"""
-            UPDATE {self.table_name}
-            SET {set_clause}
-            WHERE id = ?
-        """
+        query = _build_update_sql(self.table_name, tuple(data))
         
         with self.db_manager.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(query, tuple(data.values()) + (id,))
+            self._mark_modified()
             return cursor.rowcount > 0
         
+    def update_returning(self, id: int, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Update a record by its ID and return it in the same statement.
+        
+        Uses UPDATE ... RETURNING, so callers need no follow-up get_by_id.
+        Columns that AFTER UPDATE triggers change afterwards (such as
+        updated_at) are returned as the UPDATE itself wrote them.
+        
+        Args:
+            id: The record ID
+            data: Dictionary of column names and values to update
+            
+        Returns:
+            The updated record as a dictionary, or None if no record matched
+        """
+        query = _build_update_sql(self.table_name, tuple(data), returning=True)
+        
+        with self.db_manager.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, tuple(data.values()) + (id,))
+            row = cursor.fetchone()
+            self._mark_modified()
+            if row:
+                columns = [description[0] for description in cursor.description]
+                return dict(zip(columns, row))
+            return None
+        
     def delete(self, id: int) -> bool:
         """
         Delete a record by its ID.
@@ -149,14 +357,12 @@ class BaseRepository(Generic[T]):
         Returns:
             True if the record was deleted, False otherwise
         """
-        query = f"""
-            DELETE FROM {self.table_name}
-            WHERE id = ?
-        """
+        query = self._sql_delete
         
         with self.db_manager.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(query, (id,))
+            self._mark_modified()
             return cursor.rowcount > 0
         
     def find(self, conditions: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -169,20 +375,20 @@ class BaseRepository(Generic[T]):
         Returns:
             List of matching records as dictionaries
         """
-        if not conditions:
-            return self.get_all()
-            
-        where_clause = ' AND '.join([f"{k} = ?" for k in conditions.keys()])
-        query = f"""
-            SELECT * FROM {self.table_name}
-            WHERE {where_clause}
+        return list(self.iter_find(conditions))
+        
+    def iter_find(self, conditions: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
         """
+        Iterate over records matching the given conditions without loading them at once.
         
-        with self.db_manager.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(query, tuple(conditions.values()))
-            columns = [description[0] for description in cursor.description]
-            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+        Args:
+            conditions: Dictionary of column names and values to match
+            
+        Yields:
+            Matching records as dictionaries
+        """
+        query = _build_select_sql(self.table_name, tuple(conditions))
+        return self.db_manager.iter_query(query, tuple(conditions.values()))
         
     def find_one(self, conditions: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -197,12 +403,7 @@ class BaseRepository(Generic[T]):
         if not conditions:
             return None
             
-        where_clause = ' AND '.join([f"{k} = ?" for k in conditions.keys()])
-        query = f"""
-            SELECT * FROM {self.table_name}
-            WHERE {where_clause}
-            LIMIT 1
-        """
+        query = _build_select_sql(self.table_name, tuple(conditions), limit_one=True)
         
         with self.db_manager.get_connection() as conn:
             cursor = conn.cursor()
@@ -223,18 +424,8 @@ class BaseRepository(Generic[T]):
         Returns:
             Number of matching records
         """
-        if not conditions:
-            query = f"SELECT COUNT(*) FROM {self.table_name}"
-            with self.db_manager.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(query)
-                return cursor.fetchone()[0]
-                
-        where_clause = ' AND '.join([f"{k} = ?" for k in conditions.keys()])
-        query = f"""
-            SELECT COUNT(*) FROM {self.table_name}
-            WHERE {where_clause}
-        """
+        conditions = conditions or {}
+        query = _build_count_sql(self.table_name, tuple(conditions)) if conditions else self._sql_count
         
         with self.db_manager.get_connection() as conn:
             cursor = conn.cursor()
@@ -278,6 +469,7 @@ class BaseRepository(Generic[T]):
         with self.db_manager.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(query, (cutoff_date,))
+            self._mark_modified()
             return cursor.rowcount
 
     def get_entry_count(self) -> int:
@@ -287,7 +479,7 @@ class BaseRepository(Generic[T]):
         Returns:
             Total number of entries
         """
-        query = f"SELECT COUNT(*) FROM {self.table_name}"
+        query = self._sql_count
         
         with self.db_manager.get_connection() as conn:
             cursor = conn.cursor()
@@ -302,6 +494,7 @@ class BaseRepository(Generic[T]):
         with self.db_manager.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(query, (cutoff_date,))
+            self._mark_modified()
             return cursor.rowcount
 
     def get_entry_count(self) -> int:
@@ -311,7 +504,7 @@ class BaseRepository(Generic[T]):
         Returns:
             Total number of entries
         """
-        query = f"SELECT COUNT(*) FROM {self.table_name}"
+        query = self._sql_count
         
         with self.db_manager.get_connection() as conn:
             cursor = conn.cursor()
@@ -1,6 +1,7 @@
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timedelta
 from .base_repository import BaseRepository
+from .word_repository import WordRepository
 from ..manager import DatabaseManager
 import logging
 
@@ -208,6 +209,9 @@ class CategoryRepository(BaseRepository):
                 """, (category_id, word_id))
         except Exception as e:
             logger.error(f"Error updating category words: {str(e)}")
+        finally:
+            # Some rows may have changed even if a later update failed
+            WordRepository.mark_words_modified()
             
     def delete_category(self, category_id: int) -> bool:
         """
@@ -240,7 +244,8 @@ class CategoryRepository(BaseRepository):
                 """, (category_id,))
                 
                 conn.commit()
-                return True
+            WordRepository.mark_words_modified()
+            return True
         except Exception as e:
             logger.error(f"Error deleting category {category_id}: {str(e)}")
             return False
@@ -263,6 +268,7 @@ class CategoryRepository(BaseRepository):
                 SET category_id = ?
                 WHERE category_id = ?
             """, (target_id, source_id))
+            WordRepository.mark_words_modified()
             
             # Delete source category
             self.db_manager.execute_query("""
@@ -329,7 +335,8 @@ class CategoryRepository(BaseRepository):
                 cursor.execute(category_query, category_ids)
                 
                 conn.commit()
-                return len(category_ids)
+            WordRepository.mark_words_modified()
+            return len(category_ids)
                 
         except Exception as e:
             logger.error(f"Error cleaning up old entries: {e}")
@@ -462,7 +469,7 @@ class CategoryRepository(BaseRepository):
             List of word dictionaries
         """
         try:
-            result = self.db_manager.execute_query("""
+            result = self.db_manager.fetch_rows("""
                 SELECT 
                     id,
                     word,
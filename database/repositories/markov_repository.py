@@ -4,6 +4,15 @@ from ..manager import DatabaseManager
 from .base_repository import BaseRepository
 from collections import defaultdict
 
+# Unique key of a transition, and how a repeated transition updates its row
+TRANSITION_KEY = ['game_id', 'current_state', 'next_state']
+TRANSITION_UPDATES = {
+    'count': 'count + excluded.count',
+    'total_transitions': 'total_transitions + excluded.total_transitions',
+    'visit_count': 'visit_count + excluded.visit_count',
+    'updated_at': 'CURRENT_TIMESTAMP'
+}
+
 class MarkovRepository(BaseRepository):
     """Repository for managing Markov chain transitions."""
     
@@ -37,15 +46,14 @@ class MarkovRepository(BaseRepository):
             visit_count: Number of times this state has been visited (default: 1)
         """
         self._check_game_id()
-        self.db_manager.execute_query("""
-            INSERT INTO markov_transitions (game_id, current_state, next_state, count, total_transitions, visit_count)
-            VALUES (?, ?, ?, ?, ?, ?)
-            ON CONFLICT(game_id, current_state, next_state) DO UPDATE SET
-                count = count + ?,
-                total_transitions = total_transitions + ?,
-                visit_count = visit_count + ?,
-                updated_at = CURRENT_TIMESTAMP
-        """, (self.game_id, current_state, next_state, count, count, visit_count, count, count, visit_count))
+        self.upsert(TRANSITION_KEY, {
+            'game_id': self.game_id,
+            'current_state': current_state,
+            'next_state': next_state,
+            'count': count,
+            'total_transitions': count,
+            'visit_count': visit_count
+        }, TRANSITION_UPDATES)
         
     def get_transition_probability(self, current_state: str, next_state: str) -> float:
         """
@@ -281,7 +289,7 @@ class MarkovRepository(BaseRepository):
         self._check_game_id()
         transitions = defaultdict(dict)
         
-        results = self.db_manager.execute_query("""
+        results = self.db_manager.fetch_rows("""
             WITH totals AS (
                 SELECT current_state, SUM(count) as total
                 FROM markov_transitions
@@ -310,20 +318,19 @@ class MarkovRepository(BaseRepository):
             transitions: Dictionary mapping current states to dictionaries of next states and counts
         """
         self._check_game_id()
-        params = []
-        for current_state, next_states in transitions.items():
-            for next_state, count in next_states.items():
-                params.append((self.game_id, current_state, next_state, count, count, 1))
-                
-        self.db_manager.execute_many("""
-            INSERT INTO markov_transitions (game_id, current_state, next_state, count, total_transitions, visit_count)
-            VALUES (?, ?, ?, ?, ?, ?)
-            ON CONFLICT(game_id, current_state, next_state) DO UPDATE SET
-                count = count + excluded.count,
-                total_transitions = total_transitions + excluded.total_transitions,
-                visit_count = visit_count + excluded.visit_count,
-                updated_at = CURRENT_TIMESTAMP
-        """, params)
+        rows = [
+            {
+                'game_id': self.game_id,
+                'current_state': current_state,
+                'next_state': next_state,
+                'count': count,
+                'total_transitions': count,
+                'visit_count': 1
+            }
+            for current_state, next_states in transitions.items()
+            for next_state, count in next_states.items()
+        ]
+        self.bulk_upsert(TRANSITION_KEY, rows, TRANSITION_UPDATES)
         
     def get_state_probabilities(self, state: str) -> dict:
         """
@@ -336,7 +343,7 @@ class MarkovRepository(BaseRepository):
             Dictionary mapping next states to probabilities
         """
         self._check_game_id()
-        results = self.db_manager.execute_query("""
+        results = self.db_manager.fetch_rows("""
             WITH total AS (
                 SELECT SUM(count) as total
                 FROM markov_transitions
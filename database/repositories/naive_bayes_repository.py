@@ -71,7 +71,7 @@ class NaiveBayesRepository(BaseRepository):
         Returns:
             Dict[str, float]: Dictionary of word probabilities
         """
-        results = self.db.execute_query("""
+        results = self.db.fetch_rows("""
             SELECT word, probability
             FROM naive_bayes_words
             WHERE pattern_type = ?
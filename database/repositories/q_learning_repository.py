@@ -409,13 +409,12 @@ class QLearningRepository(BaseRepository):
                 )
             """)
             
-            self.db.execute_query("""
+            # execute() returns the new row's id from the INSERT's own cursor
+            backup_id = self.db.execute("""
                 INSERT INTO q_learning_backups (name)
                 VALUES (?)
             """, (backup_name,))
             
-            backup_id = self.db.get_scalar("SELECT last_insert_rowid()")
-            
             self.db.execute_query(f"""
                 CREATE TABLE q_learning_backup_{backup_id} AS
                 SELECT * FROM q_learning_states
@@ -9,10 +9,37 @@ logger = logging.getLogger(__name__)
 class WordRepository(BaseRepository):
     """Repository for managing word usage data."""
     
+    # Shared by every instance, since each get_word_repository() call builds a new one
+    _version = 0
+    
     def __init__(self, db_manager: DatabaseManager):
         """Initialize the word repository."""
         super().__init__(db_manager, "words")
         
+    @property
+    def version(self) -> int:
+        """
+        Change token for the words table, bumped on every write made through a repository.
+        
+        Returns:
+            The current version number
+        """
+        return WordRepository._version
+        
+    @staticmethod
+    def mark_words_modified() -> None:
+        """
+        Bump the shared version after a write to the words table.
+        
+        Other repositories that write to words directly must call this too,
+        or caches keyed on version keep serving the old rows.
+        """
+        WordRepository._version += 1
+        
+    def _mark_modified(self) -> None:
+        """Bump the shared version after a write."""
+        WordRepository.mark_words_modified()
+        
     def record_word_usage(self, word_id: int) -> None:
         """Record word usage and increment frequency."""
         self.db_manager.execute_query("""
@@ -21,6 +48,7 @@ class WordRepository(BaseRepository):
                 updated_at = CURRENT_TIMESTAMP
             WHERE id = ?
         """, (word_id,))
+        self._mark_modified()
         
     def get_word_frequency(self, word: str) -> int:
         """
@@ -246,6 +274,7 @@ class WordRepository(BaseRepository):
                 updated_at = CURRENT_TIMESTAMP
             WHERE id = ?
         """, (word_id,))
+        self._mark_modified()
         
     def search_words(self, pattern: str) -> List[Dict[str, Any]]:
         """Search for words matching a pattern."""
@@ -292,6 +321,25 @@ class WordRepository(BaseRepository):
                     updated_at = CURRENT_TIMESTAMP
                 WHERE id = ?
             """, (frequency, word_id))
+        self._mark_modified()
+        
+    def record_words(self, counts: Dict[str, int]) -> None:
+        """
+        Add each word's count to its frequency, creating words not yet stored.
+        
+        Args:
+            counts: Dictionary of word to number of uses
+        """
+        if not counts:
+            return
+        self.db_manager.execute_many("""
+            INSERT INTO words (word, frequency)
+            VALUES (?, ?)
+            ON CONFLICT(word) DO UPDATE
+            SET frequency = frequency + excluded.frequency,
+                updated_at = CURRENT_TIMESTAMP
+        """, list(counts.items()))
+        self._mark_modified()
         
     def get_words_without_category(self) -> List[Dict[str, Any]]:
         """Get words without a category."""
@@ -195,33 +195,38 @@ CREATE TABLE IF NOT EXISTS mcts_simulations (
     UNIQUE(game_id, state, action)
 );
 
--- Create indexes for frequently queried columns
-CREATE INDEX IF NOT EXISTS idx_games_player_name ON games(player_name);
-CREATE INDEX IF NOT EXISTS idx_games_status ON games(status);
+-- Create indexes for frequently queried columns. Composite indexes serve
+-- "rows for X, newest first" queries without a sort, and game_id lookups on
+-- tables with a UNIQUE(game_id, ...) constraint use that constraint's index.
+-- The low-cardinality games.status column is not indexed.
+DROP INDEX IF EXISTS idx_games_player_name;
+DROP INDEX IF EXISTS idx_games_status;
+DROP INDEX IF EXISTS idx_game_moves_game_id;
+DROP INDEX IF EXISTS idx_markov_transitions_game_id;
+DROP INDEX IF EXISTS idx_q_learning_states_game_id;
+DROP INDEX IF EXISTS idx_naive_bayes_words_game_id;
+DROP INDEX IF EXISTS idx_mcts_states_game_id;
+DROP INDEX IF EXISTS idx_mcts_simulations_game_id;
+CREATE INDEX IF NOT EXISTS idx_games_player_created_at ON games(player_name, created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_games_timestamp ON games(created_at);
-CREATE INDEX IF NOT EXISTS idx_game_moves_game_id ON game_moves(game_id);
+CREATE INDEX IF NOT EXISTS idx_game_moves_game_created_at ON game_moves(game_id, created_at);
 CREATE INDEX IF NOT EXISTS idx_game_moves_word ON game_moves(word);
 CREATE INDEX IF NOT EXISTS idx_words_category_id ON words(category_id);
 CREATE INDEX IF NOT EXISTS idx_words_domain_id ON words(domain_id);
 CREATE INDEX IF NOT EXISTS idx_words_frequency ON words(frequency);
 CREATE INDEX IF NOT EXISTS idx_ai_metrics_game_id ON ai_metrics(game_id);
-CREATE INDEX IF NOT EXISTS idx_markov_transitions_game_id ON markov_transitions(game_id);
 CREATE INDEX IF NOT EXISTS idx_markov_transitions_current_state ON markov_transitions(current_state);
 CREATE INDEX IF NOT EXISTS idx_markov_transitions_next_state ON markov_transitions(next_state);
 CREATE INDEX IF NOT EXISTS idx_markov_transitions_probability ON markov_transitions(probability);
-CREATE INDEX IF NOT EXISTS idx_q_learning_states_game_id ON q_learning_states(game_id);
 CREATE INDEX IF NOT EXISTS idx_q_learning_states_state_hash ON q_learning_states(state_hash);
 CREATE INDEX IF NOT EXISTS idx_q_learning_states_action ON q_learning_states(action);
 CREATE INDEX IF NOT EXISTS idx_q_learning_states_q_value ON q_learning_states(q_value);
 CREATE INDEX IF NOT EXISTS idx_q_learning_rewards_game_id ON q_learning_rewards(game_id);
 CREATE INDEX IF NOT EXISTS idx_q_learning_rewards_state_hash ON q_learning_rewards(state_hash);
 CREATE INDEX IF NOT EXISTS idx_q_learning_rewards_action ON q_learning_rewards(action);
-CREATE INDEX IF NOT EXISTS idx_naive_bayes_words_game_id ON naive_bayes_words(game_id);
 CREATE INDEX IF NOT EXISTS idx_naive_bayes_words_word ON naive_bayes_words(word);
 CREATE INDEX IF NOT EXISTS idx_naive_bayes_words_pattern_type ON naive_bayes_words(pattern_type);
-CREATE INDEX IF NOT EXISTS idx_mcts_states_game_id ON mcts_states(game_id);
 CREATE INDEX IF NOT EXISTS idx_mcts_states_state ON mcts_states(state);
-CREATE INDEX IF NOT EXISTS idx_mcts_simulations_game_id ON mcts_simulations(game_id);
 CREATE INDEX IF NOT EXISTS idx_mcts_simulations_state ON mcts_simulations(state);
 CREATE INDEX IF NOT EXISTS idx_mcts_simulations_action ON mcts_simulations(action);
 
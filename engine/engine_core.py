@@ -11,6 +11,7 @@ from core.game_events_manager import GameEventManager
 from engine.game_state import GameState
 from database.manager import DatabaseManager
 from database.repository_manager import RepositoryManager
+from core.validation.word_validator import flush_validators, preload_validator
 
 def setup_logging():
     """
@@ -59,6 +60,7 @@ def main():
     logger.info("Starting AI Word Strategy Game")
     logger.info(f"Log file: {log_file}")
     
+    db_manager = None
     try:
         # Initialize database manager
         db_path = Path("data/game.db")
@@ -70,6 +72,9 @@ def main():
         repo_manager = RepositoryManager(db_manager)
         logger.info("Repository manager initialized")
         
+        # Load the dictionaries while the rest of startup runs
+        preload_validator(repo_manager.repositories['word'])
+        
         # Perform initial cleanup
         repo_manager.cleanup_old_entries(force=True)
         logger.info("Initial repository cleanup completed")
@@ -81,6 +86,11 @@ def main():
         logger.error(f"Game crashed: {str(e)}", exc_info=True)
         raise
     finally:
+        if db_manager is not None:
+            # Write buffered word uses while the database is still open
+            flush_validators()
+            # Closing also lets SQLite refresh planner statistics
+            db_manager.close()
         logger.info("Game ended")
 
 if __name__ == "__main__":
@@ -6,7 +6,7 @@ from dataclasses import dataclass
 
 from core.letter_pool import generate_letter_pool
 from core.word_scoring import score_word
-from core.validation.word_validator import WordValidator
+from core.validation.word_validator import get_validator
 from core.validation.trie import Trie
 from core.game_events import GameEvent, EventType
 from core.game_events_manager import GameEventManager
@@ -64,7 +64,7 @@ class GameState:
         self.category_repo = self.repo_manager.get_repository('category')
         
         # Initialize game components
-        self.word_validator = WordValidator(self.word_repo)
+        self.word_validator = get_validator(self.word_repo)
         self.trie = Trie()
         self.ai_strategy = AIStrategy(
             event_manager=self.event_manager,
@@ -202,6 +202,8 @@ class GameState:
         if not self.word_validator.validate_word_with_letters(word, available_letters):
             print(f"🤔'{word}' is not a valid word or cannot be formed with current letters. Try again.🤔")
             return
+        # Only player submissions count towards a word's stored frequency
+        self.word_validator.record_usage(word, self.word_repo)
 
         # Get word usage count
         repeat_count = self.human_player.word_usage_counts.get(word, 0)
@@ -3,7 +3,7 @@
 
 import logging
 from collections import Counter
-from core.validation.word_validator import WordValidator
+from core.validation.word_validator import get_validator
 from core.game_events import GameEvent, EventType
 from core.game_events_manager import GameEventManager
 from database.repositories.word_repository import WordRepository
@@ -28,7 +28,7 @@ class InputHandler:
         self.event_manager = event_manager
         self.word_repo = word_repo
         self.category_repo = category_repo
-        self.word_validator = WordValidator(word_repo)
+        self.word_validator = get_validator(word_repo)
         self.command_pattern = re.compile(r'^/(\w+)(?:\s+(.+))?$')
         
     def get_player_word(self, game_state):
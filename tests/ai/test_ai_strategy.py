@@ -162,8 +162,10 @@ class TestAIStrategy(unittest.TestCase):
         self.markov_chain.get_suggestion = Mock(return_value=("TEST", 0.9))
         self.markov_chain.is_trained = True  # Set trained flag to True
 
-        # Mock the word validator
-        self.strategy.word_validator.validate_word_with_letters = Mock(return_value=True)
+        # Mock the word validator (shared between components, so restore it afterwards)
+        validator_patch = patch.object(self.strategy.word_validator, 'validate_word_with_letters', return_value=True)
+        validator_patch.start()
+        self.addCleanup(validator_patch.stop)
 
         # Mock the other models to return empty suggestions
         self.mcts.get_suggestion = Mock(return_value=("", 0.0))
@@ -179,6 +181,42 @@ class TestAIStrategy(unittest.TestCase):
         word = self.strategy.select_word(set(['T', 'E', 'S', 'T']), set(), 1)
         self.assertEqual(word, 'TEST')
 
+    def test_dictionary_fallback_candidate(self):
+        """Test the longest formable dictionary word is used when no model suggestion is valid"""
+        for name in ('markov', 'naive_bayes', 'mcts', 'q_learning'):
+            self.strategy.models[name] = MagicMock(get_suggestion=Mock(return_value=("", 0.0)))
+            
+        validator = self.strategy.word_validator
+        with patch.object(validator, 'validate_word_with_letters', return_value=False), \
+                patch.object(validator, 'get_valid_words', return_value={"SET", "TEST", "BEST"}) as get_valid_words:
+            word = self.strategy.select_word({'T', 'E', 'S', 'B'}, set(), 1)
+            
+        self.assertEqual(word, 'TEST')
+        self.assertEqual(sorted(get_valid_words.call_args[0][0]), ['B', 'E', 'S', 'T'])
+
+    def test_candidate_scoring(self):
+        """Test candidates are scored with one confidence query per model"""
+        self.strategy.models['markov'] = self.markov_chain
+        self.strategy.models['mcts'] = self.mcts
+        self.strategy.models['naive_bayes'] = self.naive_bayes
+        self.strategy.models['q_learning'] = self.q_agent
+        self.strategy.model_weights = {
+            'markov': 0.4,
+            'naive_bayes': 0.2,
+            'mcts': 0.2,
+            'q_learning': 0.2
+        }
+
+        scored = self.strategy._score_candidates({'TEST', 'BEST', 'NEST'}, {'T', 'E', 'S', 'B', 'N'})
+
+        expected = 0.9 * 0.4 + 0.8 * 0.2 + 0.7 * 0.2 + 0.6 * 0.2
+        self.assertEqual({word for word, _ in scored}, {'TEST', 'BEST', 'NEST'})
+        for _, score in scored:
+            self.assertAlmostEqual(score, expected)
+        self.markov_chain.get_suggestion.assert_called_once()
+        self.q_agent.get_suggestion.assert_called_once()
+        self.assertEqual(self.strategy._score_candidates(set(), {'T'}), [])
+
     def test_performance_tracking(self):
         """Test performance statistics tracking"""
         # Set initial stats
@@ -2,7 +2,8 @@ import unittest
 from unittest.mock import Mock, patch
 from core.game_events import GameEvent, EventType
 from core.game_events_manager import game_events_manager
-from ai.training.game_history_tracker import GameHistoryTracker
+from ai.training.game_history_tracker import GameHistoryTracker, TurnData
+from datetime import datetime
 
 class TestGameHistoryTracker(unittest.TestCase):
     def setUp(self):
@@ -183,5 +184,13 @@ class TestGameHistoryTracker(unittest.TestCase):
         self.assertIn("average_score", stats)
         self.assertIn("win_rate", stats)
 
+class TestTurnData(unittest.TestCase):
+    def test_turn_timestamp_per_turn(self):
+        """Test each turn is stamped when it is created, not when the module loaded"""
+        before = datetime.now()
+        turn = TurnData(word="HELLO", score=5, letters_used=set("HELLO"),
+                        shared_letters=[], private_letters=[], turn_number=1)
+        self.assertGreaterEqual(turn.timestamp, before)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
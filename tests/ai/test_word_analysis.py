@@ -60,8 +60,8 @@ class TestWordFrequencyAnalyzer(unittest.TestCase):
         self.assertEqual(self.analyzer.total_letters, 0)
         self.assertEqual(len(self.analyzer.letter_frequencies), 0)
         self.assertEqual(len(self.analyzer.word_lengths), 0)
-        self.assertEqual(len(self.analyzer.letter_pairs), 0)
-        self.assertEqual(len(self.analyzer.position_frequencies), 0)
+        self.assertEqual(self.analyzer.letter_pairs.sum(), 0)
+        self.assertEqual(self.analyzer.position_frequencies.sum(), 0)
         
         # Verify database initialization
         self.db_manager.execute.assert_called()
@@ -80,12 +80,15 @@ class TestWordFrequencyAnalyzer(unittest.TestCase):
         self.assertEqual(self.analyzer.word_lengths[5], 1)
         
         # Check letter pairs
-        self.assertIn('H', self.analyzer.letter_pairs)
-        self.assertEqual(self.analyzer.letter_pairs['H']['E'], 1)
+        self.assertEqual(self.analyzer.get_letter_pair_count('H', 'E'), 1)
+        self.assertEqual(self.analyzer.get_letter_pair_count('L', 'L'), 1)
+        self.assertEqual(self.analyzer.get_letter_pair_count('E', 'H'), 0)
         
         # Check position frequencies
-        self.assertEqual(self.analyzer.position_frequencies[0]['H'], 1)
-        self.assertEqual(self.analyzer.position_frequencies[1]['E'], 1)
+        self.assertEqual(self.analyzer.get_position_count('H', 0), 1)
+        self.assertEqual(self.analyzer.get_position_count('E', 1), 1)
+        self.assertEqual(self.analyzer.get_position_count('L', 2), 1)
+        self.assertEqual(self.analyzer.get_position_count('H', 1), 0)
 
     def test_analyze_word_list(self):
         """Test analysis of multiple words"""
@@ -97,6 +100,64 @@ class TestWordFrequencyAnalyzer(unittest.TestCase):
         self.assertEqual(self.analyzer.letter_frequencies['E'], 3)
         self.assertEqual(self.analyzer.word_lengths[4], 3)
 
+    def test_word_batch_matches_single_word_analysis(self):
+        """Test batch analysis produces the same counts as word-by-word analysis"""
+        words = ["HELLO", "AA", "ZEBRA", "", "NOT A WORD", "ABRACADABRA"]
+        batch_analyzer = WordFrequencyAnalyzer(
+            db_manager=self.db_manager,
+            word_repo=self.word_repo,
+            category_repo=self.category_repo
+        )
+        
+        batch_analyzer._analyze_word_batch(words)
+        for word in words:
+            self.analyzer._analyze_single_word(word)
+        
+        self.assertEqual(batch_analyzer.total_words, 4)
+        self.assertEqual(batch_analyzer.total_words, self.analyzer.total_words)
+        self.assertEqual(batch_analyzer.total_letters, self.analyzer.total_letters)
+        self.assertEqual(dict(batch_analyzer.letter_frequencies), dict(self.analyzer.letter_frequencies))
+        self.assertEqual(batch_analyzer.letter_pairs.tolist(), self.analyzer.letter_pairs.tolist())
+        self.assertEqual(batch_analyzer.letter_pair_totals.tolist(), self.analyzer.letter_pair_totals.tolist())
+        self.assertEqual(batch_analyzer.position_frequencies.tolist(), self.analyzer.position_frequencies.tolist())
+        self.assertEqual(batch_analyzer.position_totals.tolist(), self.analyzer.position_totals.tolist())
+        self.assertEqual(
+            batch_analyzer.position_totals.tolist(),
+            batch_analyzer.position_frequencies.sum(axis=1).tolist()
+        )
+        # "O" ends HELLO and "A" starts AA, but that pair crosses a word boundary
+        self.assertEqual(batch_analyzer.get_letter_pair_count('O', 'A'), 0)
+        self.assertEqual(batch_analyzer.get_letter_pair_count('A', 'B'), 2)
+
+    def test_word_list_calculates_probabilities_once(self):
+        """Test probabilities are rebuilt once per word list rather than per word"""
+        self.word_repo.get_word_usage.return_value = [
+            {"word": "hello", "frequency": 1},
+            {"word": "help", "frequency": 2},
+            {"word": "heap", "frequency": 1}
+        ]
+        
+        with patch.object(self.analyzer, '_calculate_probabilities') as calculate:
+            self.analyzer.analyze_word_list([])
+        
+        calculate.assert_called_once()
+        self.assertEqual(self.analyzer.total_words, 3)
+
+    def test_submissions_defer_probability_calculation(self):
+        """Test submitted words mark probabilities stale and the next read rebuilds them once"""
+        with patch.object(self.analyzer, '_calculate_probabilities',
+                          wraps=self.analyzer._calculate_probabilities) as calculate:
+            for word in ["HELLO", "HELP", "HEAP"]:
+                self.analyzer._handle_word_submission(GameEvent(
+                    type=EventType.WORD_SUBMITTED,
+                    data={"word": word}
+                ))
+            calculate.assert_not_called()
+            
+            self.assertAlmostEqual(self.analyzer.get_letter_probability('H'), 3 / 13)
+            self.analyzer.get_letter_probability('E')
+            calculate.assert_called_once()
+
     def test_probability_calculations(self):
         """Test probability calculations"""
         self.analyzer.analyze_word_list(["HELLO", "HELP"])
@@ -122,6 +183,31 @@ class TestWordFrequencyAnalyzer(unittest.TestCase):
         score_unknown = self.analyzer.get_word_score("XYZ")
         self.assertGreaterEqual(score_unknown, 0)
 
+    def test_word_score_cached_until_probabilities_change(self):
+        """Test word scores are memoized and invalidated by probability updates"""
+        self.word_repo.get_word_usage.return_value = [{"word": "hello", "frequency": 1}]
+        self.analyzer.analyze_word_list([])
+        
+        with patch('ai.word_analysis._english_word_frequency', return_value=0.0) as lookup:
+            first = self.analyzer.get_word_score("HELLO")
+            second = self.analyzer.get_word_score("hello")
+            self.assertEqual(first, second)
+            self.assertEqual(lookup.call_count, 1)
+            
+            self.analyzer._calculate_probabilities()
+            self.analyzer.get_word_score("HELLO")
+            self.assertEqual(lookup.call_count, 2)
+
+    def test_word_validity_cached_per_game(self):
+        """Test scoring validates each word once until the next game starts"""
+        self.analyzer.get_word_score("HELLO")
+        self.analyzer.get_word_score("hello")
+        self.assertEqual(self.word_validator.is_valid_word.call_count, 1)
+        
+        self.analyzer._handle_game_start(GameEvent(type=EventType.GAME_START, data={}))
+        self.analyzer.get_word_score("HELLO")
+        self.assertEqual(self.word_validator.is_valid_word.call_count, 2)
+
     def test_next_letter_probability(self):
         """Test letter transition probabilities"""
         self.analyzer.analyze_word_list(["HELLO", "HELP"])
@@ -134,6 +220,22 @@ class TestWordFrequencyAnalyzer(unittest.TestCase):
         prob_unknown = self.analyzer.get_next_letter_probability('X', 'Y')
         self.assertEqual(prob_unknown, 0)
 
+    def test_letter_pair_totals_track_rows(self):
+        """Test cached pair row totals stay in sync with the pair table"""
+        self.analyzer._analyze_word_batch(["HELLO", "HELP", "HEAP"])
+        self.analyzer._analyze_single_word("SHELL")
+        
+        self.assertEqual(
+            self.analyzer.letter_pair_totals.tolist(),
+            self.analyzer.letter_pairs.sum(axis=1).tolist()
+        )
+        self.assertEqual(self.analyzer.get_next_letter_probability('H', 'E'), 1.0)
+        self.assertAlmostEqual(self.analyzer.get_next_letter_probability('E', 'L'), 3 / 4)
+        
+        self.analyzer._initialize_analysis()
+        self.assertEqual(self.analyzer.letter_pair_totals.sum(), 0)
+        self.assertEqual(self.analyzer.get_next_letter_probability('H', 'E'), 0.0)
+
     def test_event_handling(self):
         """Test event system integration"""
         event = GameEvent(
@@ -145,6 +247,94 @@ class TestWordFrequencyAnalyzer(unittest.TestCase):
         self.assertEqual(self.analyzer.total_words, 1)
         self.assertEqual(self.analyzer.total_letters, 5)
 
+    def test_rarity_score_tracks_most_frequent_word(self):
+        """Test rarity is relative to the most frequently submitted word"""
+        for word in ["HELLO", "HELLO", "HELP"]:
+            self.analyzer._handle_word_submission(GameEvent(
+                type=EventType.WORD_SUBMITTED,
+                data={"word": word}
+            ))
+        
+        self.assertEqual(self.analyzer.get_word_frequency("hello"), 2)
+        self.assertEqual(self.analyzer.get_rarity_score("HELLO"), 0.0)
+        self.assertEqual(self.analyzer.get_rarity_score("HELP"), 0.5)
+        self.assertEqual(self.analyzer.get_rarity_score("HEAP"), 1.0)
+
+    def test_analyze_word_usage(self):
+        """Test usage statistics aggregated from the repository"""
+        self.word_repo.get_word_usage.return_value = [
+            {"word": "hello", "frequency": 3},
+            {"word": "help", "frequency": 2},
+            {"word": "jello", "frequency": 1},
+            {"word": "ox", "frequency": 4},
+            {"word": "hey", "frequency": 5}
+        ]
+        
+        analysis = self.analyzer.analyze_word_usage()
+        
+        self.assertEqual(analysis["total_words"], 5)
+        self.assertEqual(analysis["word_frequencies"]["HELLO"], 3)
+        self.assertEqual(dict(analysis["length_frequencies"]), {5: 4, 4: 2, 2: 4, 3: 5})
+        self.assertEqual(analysis["pattern_frequencies"]["prefix_HEL"], 5)
+        self.assertEqual(analysis["pattern_frequencies"]["suffix_LLO"], 4)
+        self.assertEqual(analysis["pattern_frequencies"]["suffix_ELP"], 2)
+        self.assertNotIn("prefix_OX", analysis["pattern_frequencies"])
+        self.assertEqual(analysis["pattern_frequencies"]["prefix_HEY"], 5)
+        self.assertEqual(analysis["pattern_frequencies"]["suffix_HEY"], 5)
+
+    def test_word_usage_cached_until_repository_changes(self):
+        """Test usage analysis is reused while the repository version is unchanged"""
+        self.word_repo.get_word_usage.return_value = [{"word": "hello", "frequency": 3}]
+        self.word_repo.version = 1
+        
+        analysis = self.analyzer.analyze_word_usage()
+        self.assertIs(self.analyzer.analyze_word_usage(), analysis)
+        self.assertEqual(self.word_repo.get_word_usage.call_count, 1)
+        
+        self.word_repo.get_word_usage.return_value = [{"word": "hello", "frequency": 4}]
+        self.word_repo.version = 2
+        
+        self.assertEqual(self.analyzer.analyze_word_usage()["word_frequencies"]["HELLO"], 4)
+        self.assertEqual(self.word_repo.get_word_usage.call_count, 2)
+
+    def test_analyzed_words_bounded(self):
+        """Test submitted words are kept in least-recently-used order up to the cap"""
+        with patch('ai.word_analysis.MAX_ANALYZED_WORDS', 2):
+            for word in ["HELLO", "HELP", "HELLO", "HEAP"]:
+                self.analyzer._handle_word_submission(GameEvent(
+                    type=EventType.WORD_SUBMITTED,
+                    data={"word": word}
+                ))
+        
+        self.assertEqual(list(self.analyzer.analyzed_words), ["HELLO", "HEAP"])
+        self.assertEqual(self.analyzer.analyzed_words["HELLO"]["frequency"], 2)
+
+    def test_analyzed_word_entries_share_one_shape(self):
+        """Test submitted and loaded words are stored as length and frequency, without a score"""
+        self.word_repo.get_word_usage.return_value = [{"word": "help", "frequency": 2}]
+        self.analyzer.analyze_word_list([])
+        self.analyzer._handle_word_submission(GameEvent(
+            type=EventType.WORD_SUBMITTED,
+            data={"word": "hello"}
+        ))
+        
+        self.assertEqual(self.analyzer.analyzed_words["HELP"], {"length": 4, "frequency": 2})
+        self.assertEqual(self.analyzer.analyzed_words["HELLO"], {"length": 5, "frequency": 1})
+        self.assertGreater(self.analyzer.get_word_score("HELLO"), 0.0)
+
+    def test_analyzed_words_bounded_on_load(self):
+        """Test the usage history loaded by analyze_word_list is trimmed to the cap"""
+        self.word_repo.get_word_usage.return_value = [
+            {"word": "hello", "frequency": 1},
+            {"word": "help", "frequency": 2},
+            {"word": "heap", "frequency": 3}
+        ]
+        with patch('ai.word_analysis.MAX_ANALYZED_WORDS', 2):
+            self.analyzer.analyze_word_list([])
+        
+        self.assertEqual(list(self.analyzer.analyzed_words), ["HELP", "HEAP"])
+        self.assertEqual(self.analyzer.analyzed_words["HEAP"]["frequency"], 3)
+
     def test_game_start_reset(self):
         """Test reset on game start"""
         self.analyzer.analyze_word_list(["HELLO"])
@@ -0,0 +1,63 @@
+# tests/core/test_analysis_output.py
+# Unit tests for analysis output handlers
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from core.analysis_output import HistoricalAnalysis
+
+class TestHistoricalAnalysis(unittest.TestCase):
+    def setUp(self):
+        """Create a historical output writing to a temporary log file"""
+        handle, self.log_path = tempfile.mkstemp()
+        os.close(handle)
+        self.output = HistoricalAnalysis(self.log_path)
+
+    def tearDown(self):
+        os.unlink(self.log_path)
+
+    def _read_log(self):
+        with open(self.log_path, encoding="utf-8") as log_file:
+            return log_file.read()
+
+    def test_records_buffered_until_threshold(self):
+        """
+        Tests that records are held in memory and written together once the threshold is reached.
+        """
+        with patch('core.analysis_output.LOG_FLUSH_THRESHOLD', 3):
+            self.output.process_analysis({'component': 'AI', 'message': 'first'})
+            self.output.process_analysis({'component': 'AI', 'message': 'second'})
+            self.assertEqual(self._read_log(), "") # Nothing written below the threshold.
+
+            self.output.process_analysis({'component': 'AI', 'message': 'third'})
+
+        log = self._read_log()
+        self.assertEqual(log.count("Full Data:"), 3) # All three records written in one flush.
+        self.assertLess(log.index("first"), log.index("third")) # Order preserved.
+
+    def test_flush_and_clear(self):
+        """
+        Tests that flush writes pending records and clear drops them without touching the log.
+        """
+        self.output.process_analysis({'component': 'AI', 'message': 'pending'})
+        self.output.flush()
+        self.assertIn("pending", self._read_log())
+
+        self.output.process_analysis({'component': 'AI', 'message': 'dropped'})
+        self.output.clear()
+        self.output.flush()
+        log = self._read_log()
+        self.assertIn("pending", log) # Records already written are kept.
+        self.assertNotIn("dropped", log)
+
+    def test_flushed_at_exit(self):
+        """
+        Tests that each output registers its flush to run at exit.
+        """
+        with patch('core.analysis_output.atexit.register') as register:
+            output = HistoricalAnalysis(self.log_path)
+        register.assert_called_once_with(output.flush)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+# tests/core/test_game_events_manager.py
+# Unit tests for event subscription, dispatch and history
+
+import unittest
+from unittest.mock import Mock
+from core.game_events import GameEvent, EventType
+from core.game_events_manager import GameEventManager
+
+class TestGameEventManager(unittest.TestCase):
+    def setUp(self):
+        """Start each test with no listeners on the shared manager"""
+        self.manager = GameEventManager()
+        self.manager.clear_listeners()
+
+    def tearDown(self):
+        self.manager.clear_listeners()
+
+    def test_emit_notifies_subscribers(self):
+        """
+        Tests that only listeners of the emitted event type are called, in subscription order.
+        """
+        calls = []
+        self.manager.subscribe(EventType.GAME_START, lambda event: calls.append("first"))
+        self.manager.subscribe(EventType.GAME_START, lambda event: calls.append("second"))
+        self.manager.subscribe(EventType.GAME_END, lambda event: calls.append("other"))
+
+        self.manager.emit(GameEvent(type=EventType.GAME_START, data={}))
+        self.assertEqual(calls, ["first", "second"])
+
+        self.manager.emit(GameEvent(type=EventType.TURN_START, data={})) # No listeners registered.
+        self.assertNotIn(EventType.TURN_START, self.manager.listeners)
+
+    def test_subscribe_during_dispatch(self):
+        """
+        Tests that a listener added while an event is dispatched only sees later events.
+        """
+        calls = []
+        def late(event):
+            calls.append("late")
+        def subscriber(event):
+            calls.append("subscriber")
+            self.manager.subscribe(EventType.GAME_START, late)
+
+        self.manager.subscribe(EventType.GAME_START, subscriber)
+        self.manager.emit(GameEvent(type=EventType.GAME_START, data={}))
+        self.assertEqual(calls, ["subscriber"])
+
+        self.manager.unsubscribe(EventType.GAME_START, subscriber)
+        self.manager.emit(GameEvent(type=EventType.GAME_START, data={}))
+        self.assertEqual(calls, ["subscriber", "late"])
+
+    def test_unsubscribe_by_token(self):
+        """
+        Tests that a token removes only its own subscription, even for a callback subscribed twice.
+        """
+        calls = []
+        def subscriber(event):
+            calls.append(event.data["turn"])
+
+        first = self.manager.subscribe(EventType.TURN_START, subscriber)
+        second = self.manager.subscribe(EventType.TURN_START, subscriber)
+        self.assertNotEqual(first, second)
+
+        self.manager.unsubscribe(EventType.TURN_START, second)
+        self.manager.emit(GameEvent(type=EventType.TURN_START, data={"turn": 0}))
+        self.assertEqual(calls, [0])
+
+        self.manager.unsubscribe(EventType.TURN_START, second) # Already removed, ignored.
+        self.manager.unsubscribe(EventType.TURN_START, first)
+        self.manager.emit(GameEvent(type=EventType.TURN_START, data={"turn": 1}))
+        self.assertEqual(calls, [0])
+
+    def test_history_bounded(self):
+        """
+        Tests that the history keeps only the most recent events, oldest first.
+        """
+        self.manager.event_history.clear()
+        total = self.manager.max_history_size + 5
+        for turn in range(total):
+            self.manager.emit(GameEvent(type=EventType.TURN_START, data={"turn": turn}))
+
+        recent = self.manager.get_recent_events()
+        self.assertIsInstance(recent, list)
+        self.assertEqual(len(recent), self.manager.max_history_size)
+        self.assertEqual(recent[0].data["turn"], 5) # The first five events were dropped.
+        self.assertEqual(recent[-1].data["turn"], total - 1)
+
+    def test_recent_events_by_type(self):
+        """
+        Tests that filtered history returns only events of the requested type, in order.
+        """
+        for turn in range(3):
+            self.manager.emit(GameEvent(type=EventType.TURN_START, data={"turn": turn}))
+            self.manager.emit(GameEvent(type=EventType.TURN_END, data={"turn": turn}))
+
+        ends = self.manager.get_recent_events(EventType.TURN_END)
+        self.assertTrue(all(event.type == EventType.TURN_END for event in ends))
+        self.assertEqual([event.data["turn"] for event in ends[-3:]], [0, 1, 2])
+
+    def test_event_defaults_per_instance(self):
+        """
+        Tests that each event gets its own creation time and debug data.
+        """
+        first = GameEvent(type=EventType.GAME_START, data={})
+        second = GameEvent(type=EventType.GAME_START, data={})
+
+        self.assertIsNot(first.debug_data, second.debug_data)
+        self.assertLessEqual(first.timestamp, second.timestamp)
+        self.assertEqual(first, GameEvent(type=EventType.GAME_START, data={}, timestamp=first.timestamp)) # Equal events share a timestamp.
+
+    def test_analysis_outputs(self):
+        """
+        Tests that events with debug data reach every output that is set, and only those.
+        """
+        dev_output = Mock()
+        history_output = Mock()
+        self.manager.dev_output = dev_output
+        self.manager.history_output = history_output
+        event = GameEvent(type=EventType.TURN_END, data={}, debug_data={"note": "analysis"})
+        try:
+            self.manager.emit(GameEvent(type=EventType.TURN_END, data={}))
+            self.manager.history_output = None
+            self.manager.emit(event)
+        finally:
+            self.manager.dev_output = None
+            self.manager.history_output = None
+
+        dev_output.process_analysis.assert_called_once_with(event)
+        history_output.process_analysis.assert_not_called()
+        self.assertEqual(self.manager._analysis_sinks, ())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -51,6 +51,21 @@ class TestLetterPool(unittest.TestCase):
         self.assertEqual(shared1, shared1)  # Sanity check
         self.assertNotEqual(boggle1, boggle2)
 
+    def test_shared_letter_constraints_for_other_sizes(self):
+        """
+        Tests that vowel/consonant mixing holds for other shared pool sizes, and that impossible sizes are rejected.
+        """
+        for num_shared in (2, 3, 6, 8, 12):
+            shared, _ = generate_letter_pool(num_shared=num_shared)
+            self.assertEqual(len(set(shared)), num_shared) # Letters stay distinct.
+            self.assertTrue(any(l in 'AEIOU' for l in shared)) # At least one vowel.
+            self.assertTrue(any(l not in 'AEIOU' for l in shared)) # At least one consonant.
+
+        with self.assertRaises(ValueError):
+            generate_letter_pool(num_shared=1) # A single letter cannot be both a vowel and a consonant.
+        with self.assertRaises(ValueError):
+            generate_letter_pool(num_shared=20) # There are only 12 common letters to draw from.
+
     #TODO
     @unittest.skip("Distribution testing requires statistical validation, not implemented.")
     def test_generate_boggle_letters_distribution(self):
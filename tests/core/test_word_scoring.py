@@ -2,7 +2,8 @@
 # Unit tests for word scoring logic
 
 import unittest
-from core.word_scoring import score_word
+from unittest.mock import Mock
+from core.word_scoring import score_word, score_words, SCORE_LUT, letter_score_map
 
 class TestWordScoring(unittest.TestCase):
     def test_base_score(self):
@@ -45,6 +46,38 @@ class TestWordScoring(unittest.TestCase):
         common_word = "SEE"  # Uses common letters
         assert score_word(rare_word) > score_word(common_word)
 
+    def test_score_words_matches_score_word(self):
+        """
+        Tests that batch scoring gives the same score as scoring each word alone.
+        """
+        validator = Mock()
+        validator.validate_word = Mock(side_effect=lambda word: word != "NOTAWORD")
+        words = ["CAT", "quiz", "ZEBRA", "JUKEBOX", "NOTAWORD", "", "quizzes"]
+
+        scores = score_words(words, validator)
+        self.assertEqual(scores.tolist(), [score_word(word, validator) for word in words])
+        self.assertEqual(scores[4], 0) # Invalid word.
+        self.assertEqual(score_words([], validator).tolist(), [])
+
+    def test_score_lut_matches_letter_map(self):
+        """
+        Tests that the byte-indexed score table agrees with the letter score map.
+        """
+        self.assertEqual(len(SCORE_LUT), 256)
+        for letter, score in letter_score_map.items():
+            self.assertEqual(SCORE_LUT[ord(letter)], score)
+        self.assertEqual(SCORE_LUT[ord('E')], 1) # Most common letter scores lowest.
+        self.assertEqual(SCORE_LUT[ord('1')], 0) # Not a letter.
+
+    def test_letter_bonus_case_insensitive(self):
+        """
+        Tests that letter bonuses are added per letter regardless of case.
+        """
+        validator = Mock()
+        validator.validate_word = Mock(return_value=True)
+        self.assertEqual(score_word("QUIZ", validator), 4 + 10 + 1 + 10) # Length plus letter bonuses; U has none.
+        self.assertEqual(score_word("quiz", validator), score_word("QUIZ", validator))
+
             
 if __name__ == "__main__":
     unittest.main() # Run the unit tests.
@@ -66,6 +66,26 @@ class TestTrie(unittest.TestCase):
         # Test deletion of empty string
         self.assertFalse(self.trie.delete(""))
 
+    def test_delete_prunes_nodes(self):
+        """Test deletion removes unused nodes and handles duplicates"""
+        self.trie.insert("HELLO")
+        self.trie.insert("HELLO")
+        self.trie.insert("HELP")
+        
+        # One copy of a duplicate word remains searchable
+        self.assertTrue(self.trie.delete("HELLO"))
+        self.assertTrue(self.trie.search("HELLO"))
+        
+        self.assertTrue(self.trie.delete("HELLO"))
+        self.assertFalse(self.trie.search("HELLO"))
+        self.assertFalse(self.trie.starts_with("HELL"))
+        self.assertEqual(self.trie.get_prefix_count("HEL"), 1)
+        
+        # Deleting the last word empties the trie
+        self.assertTrue(self.trie.delete("HELP"))
+        self.assertEqual(self.trie.root.children, {})
+        self.assertEqual(self.trie.get_prefix_count("H"), 0)
+
     def test_get_words_with_prefix(self):
         """Test retrieval of words with prefix"""
         words = ["HELLO", "HELP", "HEAP", "HAT", "HOPE"]
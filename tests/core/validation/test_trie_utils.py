@@ -70,6 +70,9 @@ class TestTrieUtils(unittest.TestCase):
         for word in self.sample_words:
             self.assertTrue(loaded_trie.search(word))
         
+        self.assertEqual(loaded_trie.get_prefix_count("HE"), original_trie.get_prefix_count("HE"))
+        self.assertFalse(loaded_trie.search("HEL"))
+        
         # Test loading non-existent file
         self.assertIsNone(TrieUtils.load_trie("nonexistent.pkl"))
 
@@ -3,7 +3,8 @@ import os
 import tempfile
 import logging
 from unittest.mock import patch, Mock, mock_open
-from core.validation.word_validator import WordValidator
+from core.validation.word_validator import WordValidator, get_validator, preload_validator, flush_validators
+from core.validation import word_validator
 
 # Configure logging
 logging.basicConfig(level=logging.DEBUG, format='%(name)s - %(levelname)s - %(message)s')
@@ -52,6 +53,52 @@ class TestWordValidator(unittest.TestCase):
         self.assertTrue(validator.is_valid_word("WORLD"))
         self.assertTrue(validator.is_valid_word("CAT"))  # CAT is valid (3 letters)
 
+    def test_usage_recorded_in_batches(self):
+        """Test submitted words are buffered and written to the repository together"""
+        validator = WordValidator(word_repo=self.mock_word_repo, use_nltk=True)
+        
+        self.assertTrue(validator.record_usage("HELLO"))
+        self.assertTrue(validator.record_usage("hello"))
+        self.assertFalse(validator.record_usage("NOTFOUND"))
+        self.assertTrue(validator.record_usage("HELP"))
+        self.mock_word_repo.record_words.assert_not_called()
+        
+        validator.close()
+        self.mock_word_repo.record_words.assert_called_once_with({"HELLO": 2, "HELP": 1})
+        
+        # A full buffer is written without an explicit flush
+        with patch('core.validation.word_validator.USAGE_FLUSH_THRESHOLD', 3):
+            for _ in range(3):
+                validator.record_usage("CAT")
+        self.mock_word_repo.record_words.assert_called_with({"CAT": 3})
+        
+        # Uses can be recorded for another repository
+        other_repo = Mock()
+        validator.record_usage("HEAP", other_repo)
+        validator.close()
+        other_repo.record_words.assert_called_once_with({"HEAP": 1})
+
+    def test_repeated_lookups_cached(self):
+        """Test repeated words reuse the cached lookup, and validation records no usage"""
+        validator = WordValidator(word_repo=self.mock_word_repo, use_nltk=True)
+        
+        for _ in range(3):
+            self.assertTrue(validator.is_valid_word("hello"))
+            self.assertFalse(validator.is_valid_word("NOTFOUND"))
+            self.assertTrue(validator.validate_word_with_letters("HELP", ['H', 'E', 'L', 'P']))
+        self.assertEqual(validator._lookup_word.cache_info().hits, 6)
+        
+        validator.flush_usage()
+        self.mock_word_repo.record_words.assert_not_called()
+
+    def test_without_word_repository(self):
+        """Test validation without a repository to record usage in"""
+        validator = WordValidator(use_nltk=True)
+
+        self.assertTrue(validator.is_valid_word("HELLO"))
+        self.assertTrue(validator.validate_word_with_letters("HELP", ['H', 'E', 'L', 'P']))
+        self.assertIsNone(validator.get_dictionary_stats()["usage_stats"])
+
     def test_initialization_with_custom_dictionary(self):
         """Test validator initialization with custom dictionary"""
         with patch("builtins.open", mock_open(read_data=self.sample_words)), \
@@ -74,6 +121,51 @@ class TestWordValidator(unittest.TestCase):
             WordValidator(word_repo=self.mock_word_repo, use_nltk=True)
             mock_download.assert_called_once_with('words', quiet=True)
 
+    def test_downloaded_corpus_is_cached(self):
+        """Test a corpus downloaded on first use goes through the word list cache"""
+        corpus_path = os.path.join(self.temp_dir, "words")
+        cache_path = os.path.join(self.temp_dir, "nltk_words.cache")
+        with open(corpus_path, 'w') as f:
+            f.write("corpus")
+        corpus = Mock(path=corpus_path, zipfile=None)
+        
+        with patch('nltk.data.find', side_effect=[LookupError, corpus]), \
+             patch('nltk.download') as mock_download, \
+             patch('core.validation.word_validator.NLTK_WORDS_CACHE_PATH', cache_path):
+            WordValidator(word_repo=self.mock_word_repo, use_nltk=True)
+            
+        mock_download.assert_called_once_with('words', quiet=True)
+        self.assertTrue(os.path.exists(cache_path))
+
+    def test_nltk_words_cached_between_instances(self):
+        """Test the filtered NLTK word list is reused while the corpus is unchanged"""
+        corpus_path = os.path.join(self.temp_dir, "words")
+        cache_path = os.path.join(self.temp_dir, "nltk_words.cache")
+        with open(corpus_path, 'w') as f:
+            f.write("corpus")
+        corpus = Mock(path=corpus_path, zipfile=None)
+        
+        with patch('nltk.data.find', return_value=corpus), \
+             patch('core.validation.word_validator.NLTK_WORDS_CACHE_PATH', cache_path):
+            first = WordValidator(word_repo=self.mock_word_repo, use_nltk=True)
+            second = WordValidator(word_repo=self.mock_word_repo, use_nltk=True)
+            
+            self.assertEqual(self.mock_nltk.words.call_count, 1)
+            self.assertIs(second.nltk_words, first.nltk_words)  # Shared in memory
+            self.assertTrue(second.is_valid_word("HELLO"))
+            
+            # A new process reads the list back from the cache file
+            word_validator._load_nltk_words.cache_clear()
+            third = WordValidator(word_repo=self.mock_word_repo, use_nltk=True)
+            self.assertEqual(self.mock_nltk.words.call_count, 1)
+            self.assertEqual(third.nltk_words, first.nltk_words)
+            
+            # A changed corpus invalidates the cache
+            with open(corpus_path, 'w') as f:
+                f.write("updated corpus")
+            WordValidator(word_repo=self.mock_word_repo, use_nltk=True)
+            self.assertEqual(self.mock_nltk.words.call_count, 2)
+
     def test_is_valid_word(self):
         """Test word validation"""
         validator = WordValidator(word_repo=self.mock_word_repo, use_nltk=True)
@@ -120,6 +212,26 @@ class TestWordValidator(unittest.TestCase):
         self.assertFalse(validator.validate_word_with_letters("", letters))
         self.assertFalse(validator.validate_word_with_letters("HELLO", []))
 
+    def test_get_valid_words(self):
+        """Test finding every dictionary word formable from a letter pool"""
+        validator = WordValidator(word_repo=self.mock_word_repo, use_nltk=True)
+        
+        self.assertEqual(validator.get_valid_words(['H', 'E', 'L', 'L', 'O', 'P']), {"HELLO", "HELP"})
+        self.assertEqual(validator.get_valid_words(['h', 'e', 'l', 'o', 'p']), {"HELP"})  # One L only
+        self.assertEqual(validator.get_valid_words(['C', 'A', 'T', 'W']), {"CAT"})
+        self.assertEqual(validator.get_valid_words(['C', 'A', 'T'], min_length=4), set())
+        self.assertEqual(validator.get_valid_words([]), set())
+        self.assertEqual(validator.get_valid_words(['H', 'E', 'O', 'P'] + ['L'] * 300), {"HELLO", "HELP"})
+        with self.assertRaises(ValueError):
+            validator.get_valid_words(['HE', 'L', 'P'])
+        with self.assertRaises(ValueError):
+            validator.get_valid_words(['H', None, 'P'])
+        
+        # Letter-set masks mark exactly the letters each word uses
+        index = list(validator._dictionary_words).index("HELP")
+        expected_mask = sum(1 << (ord(letter) - ord('A')) for letter in "HELP")
+        self.assertEqual(int(validator._letter_masks[index]), expected_mask)
+
     def test_get_word_suggestions(self):
         """Test word suggestion functionality"""
         validator = WordValidator(word_repo=self.mock_word_repo, use_nltk=True)
@@ -132,7 +244,7 @@ class TestWordValidator(unittest.TestCase):
         
         # Test max suggestions limit
         limited_suggestions = validator.get_word_suggestions("HE", max_suggestions=2)
-        self.assertEqual(len(limited_suggestions), 2)
+        self.assertEqual(limited_suggestions, ["HEAP", "HELLO"])  # Alphabetical order
         
         # Test invalid prefix
         self.assertEqual(len(validator.get_word_suggestions("XY")), 0)
@@ -177,5 +289,38 @@ class TestWordValidator(unittest.TestCase):
         self.assertTrue(validator.is_valid_word("WORLD"))  # From NLTK
         self.assertTrue(validator.is_valid_word("NOTINNLTK"))  # From custom dictionary
 
+    def test_get_validator_shared_per_configuration(self):
+        """Test that get_validator reuses one validator per dictionary configuration"""
+        other_repo = Mock()
+        with patch.dict(word_validator._shared_validators, clear=True):
+            first = get_validator(self.mock_word_repo)
+            second = get_validator(other_repo)
+            without_nltk = get_validator(self.mock_word_repo, use_nltk=False)
+            
+            # Uses are buffered per repository and written by one flush
+            first.record_usage("HELLO")
+            second.record_usage("HELP", other_repo)
+            self.mock_word_repo.record_words.assert_not_called()
+            flush_validators()
+
+        self.assertIs(first, second)
+        self.assertIs(first.word_repo, self.mock_word_repo)
+        self.assertIsNot(first, without_nltk)
+        self.assertFalse(without_nltk.use_nltk)
+        self.mock_word_repo.record_words.assert_called_once_with({"HELLO": 1})
+        other_repo.record_words.assert_called_once_with({"HELP": 1})
+        # Flushed repositories are no longer referenced by the validator
+        self.assertEqual(first._pending_usage, {})
+
+    def test_preload_validator(self):
+        """Test that a preloaded validator is the one get_validator returns"""
+        with patch.dict(word_validator._shared_validators, clear=True):
+            preload_validator(self.mock_word_repo).join()
+            preloaded = word_validator._shared_validators[(True, None)]
+            validator = get_validator(Mock())
+
+        self.assertIs(validator, preloaded)
+        self.assertTrue(validator.is_valid_word("HELLO"))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
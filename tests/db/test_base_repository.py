@@ -11,7 +11,7 @@ project_root = str(Path(__file__).parent.parent.parent)
 sys.path.insert(0, project_root)
 
 from database.manager import DatabaseManager
-from database.repositories.base_repository import BaseRepository
+from database.repositories.base_repository import BaseRepository, _build_select_sql, _build_insert_sql
 
 class TestBaseRepository(unittest.TestCase):
     def setUp(self):
@@ -200,5 +200,23 @@ class TestBaseRepository(unittest.TestCase):
         count = self.repository.count({'word': 'nonexistent'})
         self.assertEqual(count, 0)
 
+    def test_sql_text_cached(self):
+        """Test that repeated queries reuse the same SQL string."""
+        query = _build_select_sql("test_table", ("word", "allowed"), limit_one=True)
+        self.assertEqual(query, "SELECT * FROM test_table WHERE word = ? AND allowed = ? LIMIT 1")
+        self.assertIs(_build_select_sql("test_table", ("word", "allowed"), limit_one=True), query)
+        self.assertEqual(_build_select_sql("test_table", ()), "SELECT * FROM test_table")
+        self.assertEqual(_build_insert_sql("test_table", ("word", "frequency")),
+                         "INSERT INTO test_table (word, frequency) VALUES (?, ?)")
+
+    def test_invalid_identifiers_rejected(self):
+        """Test that table and column names must be plain identifiers."""
+        with self.assertRaises(ValueError):
+            BaseRepository(db_manager=self.db_manager, table_name="test_table; DROP TABLE words")
+        with self.assertRaises(ValueError):
+            self.repository.find({"word = 'x' OR 1": 1})
+        with self.assertRaises(ValueError):
+            self.repository.create({"word)": "test"})
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -149,6 +149,24 @@ def test_update_category_words(category_repo, word_repo):
     assert 'word1' in word_texts
     assert 'word2' in word_texts
 
+def test_word_writes_bump_word_version(category_repo, word_repo):
+    """Test category writes to the words table invalidate caches keyed on the word version."""
+    source = category_repo.create_category('source', 'Source category')
+    target = category_repo.create_category('target', 'Target category')
+    word_id = word_repo.create({'word': 'moved', 'category_id': source['id'], 'frequency': 1, 'allowed': True})
+    
+    version = word_repo.version
+    category_repo.update_category_words(target['id'], [word_id])
+    assert word_repo.version > version
+    
+    version = word_repo.version
+    assert category_repo.merge_categories(target['id'], source['id']) is True
+    assert word_repo.version > version
+    
+    version = word_repo.version
+    assert category_repo.delete_category(source['id']) is True
+    assert word_repo.version > version
+
 def test_delete_category(category_repo):
     """Test deleting a category."""
     # Create a test category
@@ -4,6 +4,8 @@ import tempfile
 import sys
 from pathlib import Path
 import sqlite3
+import threading
+from datetime import datetime
 
 # Add the project root to the Python path
 project_root = str(Path(__file__).parent.parent.parent)
@@ -23,6 +25,280 @@ class TestDatabaseManager(unittest.TestCase):
         self.temp_db.close()
         os.unlink(self.db_path)
         
+    def test_shared_connection(self):
+        """Test that operations reuse one configured connection until close."""
+        with self.db_manager.get_connection() as first:
+            pass
+        with self.db_manager.get_connection() as second:
+            self.assertIs(first, second)
+            self.assertEqual(second.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+            self.assertEqual(second.execute("PRAGMA foreign_keys").fetchone()[0], 1)
+            
+        # Work done in a block is committed when it ends
+        self.db_manager.execute_query("INSERT INTO categories (name) VALUES (?)", ("shared",))
+        with sqlite3.connect(self.db_path) as other:
+            self.assertEqual(other.execute("SELECT COUNT(*) FROM categories WHERE name = 'shared'").fetchone()[0], 1)
+            
+        self.db_manager.close()
+        with self.db_manager.get_connection() as reopened:
+            self.assertIsNot(reopened, first)
+        self.db_manager.close()
+        
+    def test_close_with_connection_checked_out(self):
+        """Test that a connection released after close() is closed, not reused."""
+        with self.db_manager.get_connection() as conn:
+            self.db_manager.close()
+            self.assertEqual(conn.execute("SELECT 1").fetchone()[0], 1)
+            
+        with self.assertRaises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+        with self.db_manager.get_connection() as reopened:
+            self.assertIsNot(reopened, conn)
+            self.assertEqual(reopened.execute("SELECT 1").fetchone()[0], 1)
+        self.db_manager.close()
+        
+    def test_pragma_overrides(self):
+        """Test that PRAGMA overrides apply on top of the defaults."""
+        self.db_manager.close()
+        manager = DatabaseManager(self.db_path, pragmas={"synchronous": "OFF"})
+        with manager.get_connection() as conn:
+            self.assertEqual(conn.execute("PRAGMA synchronous").fetchone()[0], 0)
+            self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+        manager.close()
+        
+    def test_context_manager_owns_connection(self):
+        """Test that a with-block holds one configured connection and releases it at the end."""
+        with self.db_manager as manager:
+            conn = manager.conn
+            self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+            manager.execute_query("INSERT INTO categories (name) VALUES (?)", ("scoped",))
+            with manager.get_connection() as inner:
+                self.assertIs(inner, conn)
+            with manager:
+                manager.execute_query("INSERT INTO categories (name) VALUES (?)", ("nested",))
+            self.assertIs(manager.conn, conn)
+                
+        # The connection goes back to the pool, which stays open for other users
+        self.assertIsNone(self.db_manager.conn)
+        self.assertFalse(conn.in_transaction)
+        with self.db_manager.get_connection() as reused:
+            self.assertIs(reused, conn)
+            self.assertEqual(reused.execute("SELECT 1").fetchone()[0], 1)
+        self.assertEqual(self.db_manager.get_scalar("SELECT COUNT(*) FROM categories"), 2)
+        
+        with self.assertRaises(RuntimeError):
+            with self.db_manager as manager:
+                manager.execute_query("INSERT INTO categories (name) VALUES (?)", ("rolled back",))
+                raise RuntimeError("abort")
+        self.assertEqual(self.db_manager.get_scalar("SELECT COUNT(*) FROM categories"), 2)
+        self.db_manager.close()
+        
+    def test_context_manager_connection_per_thread(self):
+        """Test that another thread does not join a with-block's transaction."""
+        seen = {}
+        def writer():
+            seen['conn'] = self.db_manager.conn
+            self.db_manager.execute("INSERT INTO categories (name) VALUES (?)", ("other thread",))
+            
+        with self.assertRaises(RuntimeError):
+            with self.db_manager as manager:
+                manager.execute("INSERT INTO categories (name) VALUES (?)", ("scoped",))
+                # The writer waits for this block's write lock on its own connection
+                thread = threading.Thread(target=writer)
+                thread.start()
+                raise RuntimeError("abort")
+                
+        thread.join(timeout=5)
+        self.assertFalse(thread.is_alive())
+        self.assertIsNone(seen['conn'])
+        # Only the other thread's insert, committed on its own connection, remains
+        self.assertEqual(self.db_manager.execute_query("SELECT name FROM categories"),
+                         [{'name': "other thread"}])
+        self.db_manager.close()
+        
+    def test_connection_block_is_one_transaction(self):
+        """Test that statements in one get_connection block roll back together."""
+        with self.assertRaises(sqlite3.IntegrityError):
+            with self.db_manager.get_connection() as conn:
+                self.assertIsNone(conn.isolation_level)
+                self.assertTrue(conn.in_transaction)
+                conn.execute("INSERT INTO categories (name) VALUES (?)", ("once",))
+                conn.execute("INSERT INTO categories (name) VALUES (?)", ("once",))  # UNIQUE violation
+                
+        self.assertEqual(self.db_manager.get_scalar("SELECT COUNT(*) FROM categories"), 0)
+        self.db_manager.close()
+        
+    def test_transaction(self):
+        """Test that writes in a transaction commit or roll back together."""
+        with self.db_manager.transaction():
+            self.db_manager.execute_query("INSERT INTO categories (name) VALUES (?)", ("first",))
+            with self.db_manager.transaction():
+                self.db_manager.execute_query("INSERT INTO categories (name) VALUES (?)", ("second",))
+            # Nothing is committed before the outer block ends
+            with sqlite3.connect(self.db_path) as other:
+                self.assertEqual(other.execute("SELECT COUNT(*) FROM categories").fetchone()[0], 0)
+        self.assertEqual(self.db_manager.get_scalar("SELECT COUNT(*) FROM categories"), 2)
+        
+        with self.assertRaises(RuntimeError):
+            with self.db_manager.transaction():
+                self.db_manager.execute_query("INSERT INTO categories (name) VALUES (?)", ("third",))
+                raise RuntimeError("abort")
+        self.assertEqual(self.db_manager.get_scalar("SELECT COUNT(*) FROM categories"), 2)
+        self.db_manager.close()
+        
+    def test_pooled_connections_per_thread(self):
+        """Test that another thread reads on its own connection during a transaction."""
+        seen = {}
+        def reader():
+            with self.db_manager.get_connection() as conn:
+                seen['conn'] = conn
+                seen['count'] = conn.execute("SELECT COUNT(*) FROM categories").fetchone()[0]
+                
+        with self.db_manager.transaction() as writer:
+            self.db_manager.execute_query("INSERT INTO categories (name) VALUES (?)", ("pooled",))
+            thread = threading.Thread(target=reader)
+            thread.start()
+            thread.join(timeout=5)
+            
+        self.assertFalse(thread.is_alive())
+        self.assertIsNot(seen['conn'], writer)
+        self.assertEqual(seen['count'], 0)  # The uncommitted insert is not visible
+        self.assertEqual(self.db_manager.get_scalar("SELECT COUNT(*) FROM categories"), 1)
+        self.db_manager.close()
+        
+    def test_drop_tables(self):
+        """Test that all tables are dropped, including ones other rows reference."""
+        category_id = self.db_manager.execute("INSERT INTO categories (name) VALUES (?)", ("parent",))
+        self.db_manager.execute("INSERT INTO words (word, category_id) VALUES (?, ?)", ("child", category_id))
+        
+        self.db_manager.drop_tables()
+        self.assertFalse(self.db_manager.table_exists("categories"))
+        self.assertFalse(self.db_manager.table_exists("words"))
+        self.assertEqual(self.db_manager.get_scalar("PRAGMA foreign_keys"), 1)
+        self.db_manager.close()
+        
+    def test_drop_tables_refuses_open_transaction(self):
+        """Test that drop_tables does not commit a caller's transaction."""
+        with self.assertRaises(RuntimeError):
+            with self.db_manager.transaction():
+                self.db_manager.execute_query("INSERT INTO categories (name) VALUES (?)", ("pending",))
+                self.db_manager.drop_tables()
+        self.assertEqual(self.db_manager.get_scalar("SELECT COUNT(*) FROM categories"), 0)
+        
+        with self.assertRaises(RuntimeError):
+            with self.db_manager as manager:
+                manager.execute_query("INSERT INTO categories (name) VALUES (?)", ("pending",))
+                manager.drop_tables()
+        self.assertEqual(self.db_manager.get_scalar("SELECT COUNT(*) FROM categories"), 0)
+        self.assertTrue(self.db_manager.table_exists("categories"))
+        self.db_manager.close()
+        
+    def test_execute_script_refuses_open_transaction(self):
+        """Test that execute_script does not commit a caller's transaction."""
+        with self.assertRaises(RuntimeError):
+            with self.db_manager.transaction():
+                self.db_manager.execute_query("INSERT INTO categories (name) VALUES (?)", ("pending",))
+                self.db_manager.execute_script("INSERT INTO categories (name) VALUES ('script');")
+        self.assertEqual(self.db_manager.get_scalar("SELECT COUNT(*) FROM categories"), 0)
+        self.db_manager.close()
+        
+    def test_column_names_follow_schema_changes(self):
+        """Test that cached column names are dropped when a script changes the schema."""
+        self.db_manager.execute_script("CREATE TABLE notes (id INTEGER PRIMARY KEY, body TEXT); INSERT INTO notes (body) VALUES ('a');")
+        self.assertEqual(self.db_manager.get_one("SELECT * FROM notes"), {'id': 1, 'body': 'a'})
+        self.assertEqual(self.db_manager.execute_query("SELECT * FROM notes"), [{'id': 1, 'body': 'a'}])
+        
+        self.db_manager.execute_script("ALTER TABLE notes ADD COLUMN author TEXT;")
+        self.assertEqual(self.db_manager.get_one("SELECT * FROM notes"), {'id': 1, 'body': 'a', 'author': None})
+        self.db_manager.close()
+        
+    def test_timestamps_stored_as_sqlite_strings(self):
+        """Test that bound datetimes use SQLite's layout and come back as strings."""
+        category_id = self.db_manager.execute(
+            "INSERT INTO categories (name, description) VALUES (?, ?)",
+            ("dated", datetime(2024, 5, 6, 7, 8, 9)))
+        stored = self.db_manager.get_scalar("SELECT description FROM categories WHERE id = ?", (category_id,))
+        self.assertEqual(stored, "2024-05-06 07:08:09")
+        self.assertIsInstance(self.db_manager.get_scalar("SELECT created_at FROM categories"), str)
+        self.db_manager.close()
+        
+    def test_analyze_after_create_tables(self):
+        """Test that creating tables leaves planner statistics behind."""
+        self.db_manager.execute("INSERT INTO categories (name) VALUES (?)", ("stats",))
+        self.db_manager.create_tables()
+        self.assertTrue(self.db_manager.table_exists("sqlite_stat1"))
+        self.assertGreater(self.db_manager.get_scalar("SELECT COUNT(*) FROM sqlite_stat1"), 0)
+        self.db_manager.close()
+        
+    def test_execute_many_from_generator(self):
+        """Test that execute_many writes every row of a generator in one transaction."""
+        self.db_manager.execute_many(
+            "INSERT INTO categories (name) VALUES (?)",
+            ((f"generated{i}",) for i in range(100)))
+        self.assertEqual(self.db_manager.get_scalar("SELECT COUNT(*) FROM categories"), 100)
+        
+        # A failing row rolls back the whole batch
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.db_manager.execute_many("INSERT INTO categories (name) VALUES (?)", [("new",), ("generated0",)])
+        self.assertEqual(self.db_manager.get_scalar("SELECT COUNT(*) FROM categories"), 100)
+        self.db_manager.close()
+        
+    def test_bulk_insert(self):
+        """Test multi-row inserts from a generator across several chunks."""
+        inserted = self.db_manager.bulk_insert(
+            "categories", ["name", "description"],
+            ((f"bulk{i}", None) for i in range(1201)))
+        self.assertEqual(inserted, 1201)
+        self.assertEqual(self.db_manager.get_scalar("SELECT COUNT(*) FROM categories"), 1201)
+        self.assertEqual(self.db_manager.bulk_insert("categories", ["name"], []), 0)
+        self.db_manager.close()
+        
+    def test_fetch_rows(self):
+        """Test that fetch_rows returns Row objects without changing other queries."""
+        self.db_manager.execute_query("INSERT INTO categories (name) VALUES (?)", ("rows",))
+        rows = self.db_manager.fetch_rows("SELECT id, name FROM categories WHERE name = ?", ("rows",))
+        self.assertEqual(len(rows), 1)
+        self.assertIsInstance(rows[0], sqlite3.Row)
+        self.assertEqual(rows[0]['name'], "rows")
+        self.assertEqual(dict(rows[0])['name'], "rows")
+        
+        # Other queries on the shared connection still return dictionaries
+        self.assertEqual(self.db_manager.get_one("SELECT name FROM categories WHERE name = ?", ("rows",)),
+                         {'name': "rows"})
+        
+    def test_abandoned_iter_query_releases_connection(self):
+        """Test that closing iter_query halfway rolls back and returns its connection."""
+        self.db_manager.bulk_insert("categories", ["name"], ((f"iter{i}",) for i in range(10)))
+        with self.db_manager.get_connection() as pooled:
+            pass
+            
+        rows = self.db_manager.iter_query("SELECT name FROM categories ORDER BY id")
+        self.assertEqual(next(rows), {'name': "iter0"})
+        self.assertTrue(pooled.in_transaction)
+        rows.close()
+        
+        self.assertFalse(pooled.in_transaction)
+        with self.db_manager.get_connection() as conn:
+            self.assertIs(conn, pooled)
+        self.db_manager.close()
+        
+    def test_write_during_partial_iteration(self):
+        """Test that a write made inside an abandoned iter_query loop is kept."""
+        self.db_manager.bulk_insert("categories", ["name"], ((f"iter{i}",) for i in range(3)))
+        for row in self.db_manager.iter_query("SELECT name FROM categories ORDER BY id"):
+            self.db_manager.execute("INSERT INTO categories (name) VALUES (?)", ("written",))
+            break
+            
+        self.assertEqual(self.db_manager.get_scalar("SELECT COUNT(*) FROM categories"), 4)
+        
+        # Inside a transaction the loop reads through, and commits with, the block
+        with self.db_manager.transaction():
+            for row in self.db_manager.iter_query("SELECT name FROM categories ORDER BY id"):
+                self.db_manager.execute("INSERT INTO categories (name) VALUES (?)", ("in block",))
+                break
+        self.assertEqual(self.db_manager.get_scalar("SELECT COUNT(*) FROM categories"), 5)
+        self.db_manager.close()
+        
     def test_create_tables(self):
         """Test that all tables are created correctly."""
         # Create tables
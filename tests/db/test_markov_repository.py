@@ -142,5 +142,23 @@ class TestMarkovRepository(unittest.TestCase):
         """)
         self.assertEqual(result[0]['count'], 0)
 
+    def test_repeated_transitions_upserted(self):
+        """Test that repeated transitions update one row instead of adding rows."""
+        game_id = self.db_manager.execute("INSERT INTO games (player_name) VALUES (?)", ("player",))
+        self.markov_repo.set_game_id(game_id)
+        
+        self.markov_repo.record_transition("abc", "d", count=2)
+        self.markov_repo.record_transition("abc", "d")
+        self.markov_repo.bulk_record_transitions({"abc": {"d": 3, "e": 1}})
+        
+        rows = self.db_manager.execute_query("""
+            SELECT next_state, count, total_transitions, visit_count FROM markov_transitions
+            WHERE game_id = ? ORDER BY next_state
+        """, (game_id,))
+        self.assertEqual(rows, [
+            {'next_state': 'd', 'count': 6, 'total_transitions': 6, 'visit_count': 3},
+            {'next_state': 'e', 'count': 1, 'total_transitions': 1, 'visit_count': 1}
+        ])
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -59,6 +59,86 @@ class TestWordRepository(unittest.TestCase):
         self.assertEqual(word['word'], 'test')
         self.assertEqual(word['frequency'], 10)
         
+    def test_version_changes_on_write(self):
+        """Test the version token advances on writes and is shared across instances."""
+        other = WordRepository(db_manager=self.db_manager)
+        version = self.repository.version
+        
+        self.repository.get_all_words()
+        self.assertEqual(self.repository.version, version)
+        
+        self.repository.add_word('test', self.category_id)
+        self.assertGreater(self.repository.version, version)
+        self.assertEqual(other.version, self.repository.version)
+        
+    def test_bulk_create(self):
+        """Test creating many words in one call."""
+        version = self.repository.version
+        rows = [
+            {'word': f'bulk{i}', 'category_id': self.category_id, 'frequency': i}
+            for i in range(50)
+        ]
+        
+        self.assertEqual(self.repository.bulk_create(rows), 50)
+        self.assertEqual(self.repository.get_word_frequency('bulk49'), 49)
+        self.assertEqual(self.repository.get_word_count_by_category(self.category_id), 50)
+        self.assertGreater(self.repository.version, version)
+        self.assertEqual(self.repository.bulk_create([]), 0)
+        
+        with self.assertRaises(ValueError):
+            self.repository.bulk_create([{'word': 'a'}, {'word': 'b', 'frequency': 1}])
+            
+    def test_bulk_create_values(self):
+        """Test multi-row inserts spanning several statements."""
+        rows = [
+            {'word': f'multi{i}', 'category_id': self.category_id, 'frequency': i}
+            for i in range(1000)  # More rows than fit in one statement
+        ]
+        
+        self.assertEqual(self.repository.bulk_create_values(rows), 1000)
+        self.assertEqual(self.repository.get_word_frequency('multi999'), 999)
+        self.assertEqual(self.repository.get_word_count_by_category(self.category_id), 1000)
+        
+        with self.assertRaises(ValueError):
+            self.repository.bulk_create_values([{'word': 'a'}, {'frequency': 1}])
+            
+    def test_update_returning(self):
+        """Test updating a word and getting the row back."""
+        word_id = self.repository.create({'word': 'returning', 'category_id': self.category_id, 'frequency': 1})
+        
+        row = self.repository.update_returning(word_id, {'frequency': 7})
+        self.assertEqual(row['id'], word_id)
+        self.assertEqual(row['word'], 'returning')
+        self.assertEqual(row['frequency'], 7)
+        self.assertEqual(self.repository.get_word_frequency('returning'), 7)
+        self.assertIsNone(self.repository.update_returning(word_id + 1000, {'frequency': 1}))
+        
+    def test_iter_find(self):
+        """Test streaming records matching conditions."""
+        self.repository.bulk_create([
+            {'word': f'iter{i}', 'category_id': self.category_id, 'frequency': i % 2}
+            for i in range(10)
+        ])
+        
+        rows = self.repository.iter_find({'category_id': self.category_id, 'frequency': 1})
+        self.assertNotIsInstance(rows, list)
+        self.assertEqual(sorted(row['word'] for row in rows), [f'iter{i}' for i in range(1, 10, 2)])
+        self.assertEqual(len(self.repository.find({'frequency': 0})), 5)
+        self.assertEqual(len(list(self.repository.iter_all())), len(self.repository.get_all()))
+        
+    def test_record_words(self):
+        """Test batched usage adds to existing frequencies and creates new words."""
+        self.repository.add_word('EXISTING', self.category_id)
+        version = self.repository.version
+        
+        self.repository.record_words({'EXISTING': 2, 'NEWWORD': 3})
+        self.repository.record_words({'EXISTING': 1})
+        
+        self.assertEqual(self.repository.get_word_frequency('EXISTING'), 3)
+        self.assertEqual(self.repository.get_word_frequency('NEWWORD'), 3)
+        self.assertEqual(self.repository.get_by_word('EXISTING')['category_id'], self.category_id)
+        self.assertGreater(self.repository.version, version)
+        
     def test_record_word_usage(self):
         """Test recording word usage."""
         # Test adding new word